@@ -5,14 +5,17 @@ import argparse
 import datetime as dt
 import gzip
 import hashlib
+import io
 import json
 import os
 import re
 import shutil
 import sys
 import tempfile
+import traceback
 import uuid
 from collections import Counter
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import Any, Iterable
 
@@ -26,6 +29,8 @@ HORIZONS = {"now", "day", "week", "month", "quarter", "year"}
 SALIENCE_LEVELS = {"low", "medium", "high"}
 OBJECT_STATUSES = {"active", "completed", "cancelled", "superseded", "invalid"}
 VISIBILITY_LEVELS = {"private", "project", "global"}
+# Commands that read requests from stdin and so cannot be nested inside one.
+NESTED_COMMANDS = {"serve", "batch"}
 
 EVENT_TYPES = {
     "memory.instance.started",
@@ -2710,6 +2715,136 @@ def command_stats(args: argparse.Namespace) -> int:
     return 0
 
 
+def run_captured(func: Any, args: argparse.Namespace) -> dict[str, Any]:
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            exit_code = int(func(args))
+    except MemoryCtlError as exc:
+        return {"ok": False, "error": str(exc), "exit_code": 1}
+    try:
+        payload = json.loads(buffer.getvalue())
+    except json.JSONDecodeError:
+        return {"ok": False, "error": "unable to parse command output", "exit_code": exit_code}
+    if not isinstance(payload, dict):
+        return {"ok": False, "error": "unexpected command output", "exit_code": exit_code}
+    payload.setdefault("exit_code", exit_code)
+    return payload
+
+
+def command_probe(args: argparse.Namespace) -> int:
+    root = args.root
+    probes = [
+        ("stats", command_stats, argparse.Namespace(root=root, scope=args.scope)),
+        ("validate_strict", command_validate, argparse.Namespace(root=root, strict=True)),
+        (
+            "diagnose_dry_run",
+            command_diagnose,
+            argparse.Namespace(
+                root=root,
+                scope=args.scope,
+                project=args.project,
+                stale_seconds=args.stale_seconds,
+                dry_run=True,
+            ),
+        ),
+        (
+            "optimize_dry_run",
+            command_optimize,
+            argparse.Namespace(root=root, max_actions=args.max_actions, execute=False, dry_run=True),
+        ),
+    ]
+
+    payload: dict[str, Any] = {"ok": True}
+    for key, func, probe_args in probes:
+        result = run_captured(func, probe_args)
+        payload[key] = result
+        if not result.get("ok"):
+            payload["ok"] = False
+
+    print_json(payload)
+    return 0 if payload["ok"] else 1
+
+
+def run_argv(parser: argparse.ArgumentParser, argv: list[str]) -> dict[str, Any]:
+    """Run one command line in-process and capture what it would have printed."""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            exit_code = dispatch(parser, argv)
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+        except Exception:  # noqa: BLE001 - mirror an uncaught error in a child process
+            traceback.print_exc()
+            exit_code = 1
+    return {
+        "ok": exit_code == 0,
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def check_request_argv(argv: Any) -> list[str]:
+    if not isinstance(argv, list) or not all(isinstance(item, str) for item in argv):
+        raise ValueError("argv must be a list of strings")
+    if argv and argv[0] in NESTED_COMMANDS:
+        raise ValueError(f"{argv[0]} cannot run inside {'/'.join(sorted(NESTED_COMMANDS))}")
+    return argv
+
+
+def command_batch(args: argparse.Namespace) -> int:
+    try:
+        if args.spec == "-":
+            spec = json.load(sys.stdin)
+        else:
+            spec = json.loads(Path(args.spec).read_text(encoding="utf-8"))
+        if not isinstance(spec, list):
+            raise ValueError("spec must be a JSON list of argv lists")
+        argvs = [check_request_argv(item) for item in spec]
+    except (OSError, ValueError) as exc:
+        raise MemoryCtlError(f"invalid batch spec: {exc}") from exc
+
+    parser = build_parser()
+    results = []
+    for argv in argvs:
+        result = {"argv": argv, **run_argv(parser, argv)}
+        results.append(result)
+        if args.jsonl:
+            # Flushed per command, so a caller that times out keeps finished results.
+            sys.stdout.write(json.dumps(result, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+    payload = {"ok": all(result["exit_code"] == 0 for result in results), "results": results}
+    if not args.jsonl:
+        print_json(payload)
+    return 0 if payload["ok"] else 1
+
+
+def command_serve(args: argparse.Namespace) -> int:
+    parser = build_parser()
+    # Signal readiness so clients can tell a serving build from an older one.
+    sys.stdout.write(json.dumps({"ok": True, "ready": True}) + "\n")
+    sys.stdout.flush()
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            argv = check_request_argv(json.loads(line)["argv"])
+        except (ValueError, KeyError, TypeError) as exc:
+            response: dict[str, Any] = {
+                "ok": False,
+                "exit_code": 2,
+                "stdout": "",
+                "stderr": f"invalid request: {exc}\n",
+            }
+        else:
+            response = run_argv(parser, argv)
+        sys.stdout.write(json.dumps(response, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
 def add_root_arg(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--root", default=os.environ.get("MEMORY_ROOT", ".memory"), help="Memory root path")
 
@@ -2909,11 +3044,26 @@ def build_parser() -> argparse.ArgumentParser:
     p_stats.add_argument("--scope")
     p_stats.set_defaults(func=command_stats)
 
+    p_probe = sub.add_parser("probe", help="Run stats, strict validate, and dry-run diagnose/optimize in one call")
+    add_root_arg(p_probe)
+    p_probe.add_argument("--scope")
+    p_probe.add_argument("--project")
+    p_probe.add_argument("--stale-seconds", type=int, default=1800)
+    p_probe.add_argument("--max-actions", type=int, default=5)
+    p_probe.set_defaults(func=command_probe)
+
+    p_batch = sub.add_parser("batch", help="Run a JSON list of command lines in order in one process")
+    p_batch.add_argument("--spec", default="-", help="Path to the JSON spec, or - for stdin")
+    p_batch.add_argument("--jsonl", action="store_true", help="Print each result as one JSON line as it finishes")
+    p_batch.set_defaults(func=command_batch)
+
+    p_serve = sub.add_parser("serve", help="Run newline-delimited JSON command requests from stdin")
+    p_serve.set_defaults(func=command_serve)
+
     return parser
 
 
-def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+def dispatch(parser: argparse.ArgumentParser, argv: list[str] | None) -> int:
     args = parser.parse_args(argv)
     try:
         return int(args.func(args))
@@ -2925,5 +3075,9 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
 
+def main(argv: list[str] | None = None) -> int:
+    return dispatch(build_parser(), argv)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .io_utils import decode_json
+
 
 @dataclass
 class AgentConfig:
@@ -79,6 +80,7 @@ class ObjectiveGateConfig:
     provisional_confirm_min_validation_confidence: float = 0.85
     provisional_confirm_min_hard_pass_rate: float = 1.0
     provisional_confirm_max_provider_blocked_rate: float = 0.0
+    early_exit_on_hard_fail: bool = False
 
 
 @dataclass
@@ -108,10 +110,13 @@ class EvolutionConfig:
     synthesis: ScenarioSynthesisConfig = field(default_factory=ScenarioSynthesisConfig)
     runtime_lane: RuntimeLaneConfig = field(default_factory=RuntimeLaneConfig)
     objectives: ObjectiveGateConfig = field(default_factory=ObjectiveGateConfig)
+    judge_cache: bool = True
+    archive_scenarios: bool = False
+    runner_artifact_mode: str = "per-turn"
 
     @classmethod
     def from_file(cls, file_path: Path) -> "EvolutionConfig":
-        payload = json.loads(file_path.read_text(encoding="utf-8"))
+        payload = decode_json(file_path.read_bytes())
 
         runner = AgentConfig(**payload.get("runner", {}))
         judge = AgentConfig(**payload.get("judge", {}))
@@ -156,6 +161,9 @@ class EvolutionConfig:
             synthesis=synthesis,
             runtime_lane=runtime_lane,
             objectives=objectives,
+            judge_cache=bool(payload.get("judge_cache", True)),
+            archive_scenarios=bool(payload.get("archive_scenarios", False)),
+            runner_artifact_mode=str(payload.get("runner_artifact_mode", "per-turn")),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -185,4 +193,7 @@ class EvolutionConfig:
             "synthesis": self.synthesis.__dict__,
             "runtime_lane": self.runtime_lane.__dict__,
             "objectives": self.objectives.__dict__,
+            "judge_cache": self.judge_cache,
+            "archive_scenarios": self.archive_scenarios,
+            "runner_artifact_mode": self.runner_artifact_mode,
         }
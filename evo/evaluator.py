@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from pathlib import Path
@@ -10,6 +11,14 @@ from .models import SCORE_DIMENSIONS, ScenarioExecution, ScenarioResult
 from .opencode_client import OpenCodeClient
 
 
+# How much of the execution the judge prompt shows.
+PROMPT_COMMAND_TAIL = 10
+PROMPT_MESSAGE_TAIL = 4
+# Fallback turns name their instance and session after the epoch.
+EPOCH_SCOPED_ID_RE = re.compile(r"\b(ins-fallback|fallback-session)-e\d+-t")
+JUDGE_SKIPPED_VIOLATION = "Judge skipped: snapshot already failed hard memory integrity gates."
+
+
 class SkillJudge:
     def __init__(
         self,
@@ -18,11 +27,13 @@ class SkillJudge:
         judge_contract: str,
         workspace_root: Path,
         skill_paths: list[str],
+        cache_dir: Path | None = None,
     ) -> None:
         self.client = client
         self.judge_contract = judge_contract
         self.workspace_root = workspace_root
         self.skill_paths = skill_paths
+        self.cache_dir = cache_dir
 
     def score(
         self,
@@ -43,6 +54,22 @@ class SkillJudge:
         prompt = self._build_prompt(
             prompt_payload=prompt_payload,
         )
+
+        cache_path = self._cache_path(prompt_payload, execution=execution)
+        cached = _read_cached_verdict(cache_path)
+        if cached is not None:
+            write_json(
+                artifact_dir / "judge-result.json",
+                {
+                    "parsed": cached,
+                    "cache_hit": True,
+                    "cache_path": _display_path(cache_path, self.workspace_root),
+                    "input_path": _display_path(input_path, self.workspace_root),
+                    "prompt_payload": prompt_payload,
+                },
+            )
+            return cached
+
         judge_run = self.client.run_message(
             prompt,
             title=f"judge-{execution.scenario.id}-epoch-{execution.epoch}",
@@ -94,6 +121,9 @@ class SkillJudge:
         parsed.setdefault("strengths", [])
         parsed.setdefault("next_focus", [])
 
+        if cache_path is not None and "judge_response_not_json" not in parsed["hard_failures"]:
+            write_json(cache_path, parsed)
+
         write_json(
             artifact_dir / "judge-result.json",
             {
@@ -109,6 +139,42 @@ class SkillJudge:
         )
         return parsed
 
+    def _cache_path(
+        self,
+        prompt_payload: dict[str, Any],
+        *,
+        execution: ScenarioExecution,
+    ) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        # Session ids, the per-scenario memory root and epoch-scoped fallback
+        # ids differ on every run but carry nothing the verdict depends on.
+        # The tails are normalized before clipping, since the root's length
+        # would otherwise move the clip point.
+        root_forms = _memory_root_forms(execution.memory_root, self.workspace_root)
+        key_execution = {
+            "read_paths": execution.read_paths,
+            "command_trace_tail": [
+                _normalize_cache_key_text(command, root_forms)
+                for command in execution.command_trace[-PROMPT_COMMAND_TAIL:]
+            ],
+            "assistant_messages_tail": [
+                _normalize_cache_key_text(text, root_forms)
+                for text in execution.assistant_messages[-PROMPT_MESSAGE_TAIL:]
+            ],
+        }
+        key_prompt = self._build_prompt(
+            prompt_payload={**prompt_payload, "execution": key_execution},
+        )
+        digest = hashlib.sha256(
+            json.dumps(
+                {"agent": self.client.agent_config.__dict__, "prompt": key_prompt},
+                sort_keys=True,
+                ensure_ascii=True,
+            ).encode("utf-8")
+        ).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest[2:]}.json"
+
     def _build_prompt(
         self,
         *,
@@ -183,13 +249,13 @@ class SkillJudge:
 
         command_tail = execution.get("command_trace_tail", [])
         if isinstance(command_tail, list):
-            command_tail = command_tail[-10:]
+            command_tail = command_tail[-PROMPT_COMMAND_TAIL:]
         else:
             command_tail = []
 
         messages_tail = execution.get("assistant_messages_tail", [])
         if isinstance(messages_tail, list):
-            messages_tail = messages_tail[-4:]
+            messages_tail = messages_tail[-PROMPT_MESSAGE_TAIL:]
         else:
             messages_tail = []
 
@@ -427,6 +493,47 @@ def score_execution(
     )
 
 
+def _read_cached_verdict(cache_path: Path | None) -> dict[str, Any] | None:
+    if cache_path is None or not cache_path.is_file():
+        return None
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not _is_valid_judge_payload(payload):
+        return None
+    return payload
+
+
+def skipped_judge_result(
+    *,
+    execution: ScenarioExecution,
+    probe: dict[str, Any],
+    reason: str,
+) -> ScenarioResult:
+    return ScenarioResult(
+        scenario_id=execution.scenario.id,
+        partition=execution.partition,
+        epoch=execution.epoch,
+        memory_root=str(execution.memory_root),
+        session_id=execution.session_id,
+        hard_pass=False,
+        fitness=0.0,
+        judge_score=0.0,
+        dimensions={key: 0.0 for key in SCORE_DIMENSIONS},
+        violations=[reason],
+        strengths=[],
+        next_focus=[],
+        probe=probe,
+        command_trace=execution.command_trace,
+        artifact_dir=str(execution.artifact_dir),
+        fallback_used=execution.fallback_used,
+        provider_blocked=execution.provider_blocked,
+        provider_block_reasons=execution.provider_block_reasons,
+        validation_confidence=0.0,
+    )
+
+
 def _normalize_dimensions(payload: dict[str, Any]) -> dict[str, float]:
     normalized: dict[str, float] = {}
     for key in SCORE_DIMENSIONS:
@@ -526,6 +633,24 @@ def _normalize_cli_text(value: str) -> str:
     return value.replace("\\", "/").replace('"', "")
 
 
+def _memory_root_forms(memory_root: Path, workspace_root: Path) -> list[str]:
+    forms = {str(memory_root), Path(memory_root).as_posix()}
+    try:
+        relative = Path(memory_root).resolve().relative_to(workspace_root.resolve())
+    except ValueError:
+        pass
+    else:
+        forms.update({str(relative), relative.as_posix()})
+    # Longest first, so an absolute root is replaced before its relative tail.
+    return sorted(forms, key=len, reverse=True)
+
+
+def _normalize_cache_key_text(text: str, root_forms: list[str]) -> str:
+    for form in root_forms:
+        text = text.replace(form, "<memory_root>")
+    return EPOCH_SCOPED_ID_RE.sub(r"\1-e*-t", text)
+
+
 def _display_path(path: Path, workspace_root: Path) -> str:
     try:
         return path.resolve().relative_to(workspace_root.resolve()).as_posix()
@@ -804,6 +929,10 @@ def aggregate_scores(results: list[ScenarioResult]) -> tuple[float, float]:
     if not results:
         return 0.0, 0.0
 
-    total_fitness = sum(item.fitness for item in results)
-    hard_count = sum(1 for item in results if item.hard_pass)
+    total_fitness = 0.0
+    hard_count = 0
+    for item in results:
+        total_fitness += item.fitness
+        if item.hard_pass:
+            hard_count += 1
     return total_fitness / len(results), hard_count / len(results)
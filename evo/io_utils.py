@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import contextlib
 import json
 import os
+import py_compile
+import queue
 import subprocess
+import tempfile
+import threading
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:  # optional fast path; the stdlib encoder is always available
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 
 @dataclass
 class CommandResult:
@@ -24,24 +35,163 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def write_json(path: Path, payload: object) -> None:
-    ensure_dir(path.parent)
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
+def ensure_dirs(paths: Iterable[Path]) -> None:
+    for path in dict.fromkeys(paths):
+        path.mkdir(parents=True, exist_ok=True)
+
+
+def write_json(path: str | os.PathLike[str], payload: object) -> None:
+    write_bytes_atomic(path, encode_json(payload))
+
+
+def write_bytes_atomic(path: str | os.PathLike[str], data: bytes) -> None:
+    # Write to a uniquely named sibling temp file and rename it into place, so
+    # a crash or a stop mid-write never leaves a truncated artifact behind and
+    # concurrent writers to one target never share a temp file.
+    directory, name = os.path.split(os.fspath(path))
+    # Directories are usually created up front, so only mkdir on a miss.
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=name + ".", suffix=".tmp", dir=directory or None)
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=name + ".", suffix=".tmp", dir=directory or None)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def encode_json(payload: object) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+            )
+        except TypeError:
+            pass
+    return (json.dumps(payload, indent=2, ensure_ascii=True) + "\n").encode("utf-8")
+
+
+def encode_json_line(payload: object) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+            )
+        except TypeError:
+            pass
+    return (json.dumps(payload, ensure_ascii=True, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def decode_json(data: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class JsonWriter:
+    """Write JSON artifacts on a background thread.
+
+    Payloads must not be mutated after ``submit``. ``flush`` blocks until the
+    queue is drained and re-raises the first write error, if any.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[tuple[str | os.PathLike[str], object]] = queue.Queue()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._drain,
+            name="json-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit(self, path: str | os.PathLike[str], payload: object) -> None:
+        self._queue.put((path, payload))
+
+    def flush(self) -> None:
+        self._queue.join()
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _drain(self) -> None:
+        while True:
+            path, payload = self._queue.get()
+            try:
+                write_json(path, payload)
+            except Exception as exc:  # noqa: BLE001
+                if self._error is None:
+                    self._error = exc
+            finally:
+                self._queue.task_done()
 
 
 def run_command(
     args: list[str],
     cwd: Path,
     timeout_seconds: int | None = None,
+    input_text: str | None = None,
 ) -> CommandResult:
     return _run_subprocess(
         command=args,
         cwd=cwd,
         timeout_seconds=timeout_seconds,
         shell=False,
+        input_text=input_text,
     )
 
 
+# `python memoryctl.py` recompiles the script as __main__ on every spawn;
+# importing it instead reuses its mtime-checked __pycache__ bytecode.
+MEMORYCTL_LOADER = (
+    "import os, sys; sys.argv = sys.argv[1:]; "
+    "sys.path.insert(0, os.path.dirname(os.path.abspath(sys.argv[0]))); "
+    "import memoryctl; raise SystemExit(memoryctl.main())"
+)
+
+
+def memoryctl_process_args(args: list[str]) -> list[str]:
+    """Process argv for a ``python .../memoryctl.py ...`` command line.
+
+    The interpreter also skips ``site`` (``-S``); memoryctl is stdlib-only.
+    Other command lines are returned unchanged.
+    """
+    if len(args) >= 2 and args[0] == "python" and args[1].endswith("memoryctl.py"):
+        return [args[0], "-S", "-c", MEMORYCTL_LOADER, *args[1:]]
+    return args
+
+
+def precompile_memoryctl(workspace_root: Path) -> None:
+    """Write checked-hash bytecode for the workspace memoryctl.py.
+
+    Timestamp pycs only record whole-second mtimes, so a same-size mutation
+    landing in the same second could run stale code; checked-hash pycs are
+    revalidated against the source on every import and stay checked-hash
+    when the import system rewrites them.
+    """
+    try:
+        py_compile.compile(
+            str(workspace_root / ".opencode/skills/diasync-memory/scripts/memoryctl.py"),
+            doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+        )
+    except (OSError, py_compile.PyCompileError):
+        # Missing or broken scripts surface when the command actually runs.
+        pass
+
+
 def run_shell_command(
     command: str,
     cwd: Path,
@@ -134,10 +284,12 @@ def _run_subprocess(
     cwd: Path,
     timeout_seconds: int | None,
     shell: bool,
+    input_text: str | None = None,
 ) -> CommandResult:
     process = subprocess.Popen(
         command,
         cwd=str(cwd),
+        stdin=subprocess.PIPE if input_text is not None else None,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
@@ -145,7 +297,7 @@ def _run_subprocess(
     )
 
     try:
-        stdout_text, stderr_text = process.communicate(timeout=timeout_seconds)
+        stdout_text, stderr_text = process.communicate(input=input_text, timeout=timeout_seconds)
         return CommandResult(
             args=[command] if isinstance(command, str) else command,
             exit_code=int(process.returncode or 0),
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -14,7 +15,7 @@ SCORE_DIMENSIONS = (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
     id: str
     title: str
@@ -39,6 +40,32 @@ class RunEvents:
     tool_commands: list[str]
     tool_calls: list[dict[str, Any]]
 
+    @cached_property
+    def memoryctl_count(self) -> int:
+        if not self.has_memoryctl:
+            return 0
+        return sum("memoryctl.py" in command for command in self.tool_commands)
+
+    @cached_property
+    def has_memoryctl(self) -> bool:
+        # One scan over a joined buffer; the separator cannot occur in the marker.
+        return "memoryctl.py" in "\x1f".join(self.tool_commands)
+
+    @cached_property
+    def error_data(self) -> list[dict[str, Any]]:
+        # `error.data` payloads of error events, walked once per run.
+        payloads: list[dict[str, Any]] = []
+        for event in self.events:
+            if not isinstance(event, dict) or event.get("type") != "error":
+                continue
+            error_payload = event.get("error")
+            if not isinstance(error_payload, dict):
+                continue
+            data = error_payload.get("data")
+            if isinstance(data, dict):
+                payloads.append(data)
+        return payloads
+
 
 @dataclass
 class ScenarioExecution:
@@ -21,10 +21,11 @@ class OpenCodeClient:
         *,
         progress_callback: Callable[[str, dict[str, Any]], None] | None = None,
         heartbeat_seconds: int = 15,
+        executable: str | None = None,
     ) -> None:
         self.workspace_root = workspace_root
         self.agent_config = agent_config
-        self.executable = _resolve_opencode_executable()
+        self.executable = executable or resolve_opencode_executable()
         self.progress_callback = progress_callback
         self.heartbeat_seconds = max(1, heartbeat_seconds)
 
@@ -198,7 +199,7 @@ class OpenCodeClient:
             self.progress_callback(event, payload)
 
 
-def _resolve_opencode_executable() -> str:
+def resolve_opencode_executable() -> str:
     env_override = os.getenv("OPENCODE_BIN")
     if env_override:
         return env_override
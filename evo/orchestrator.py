@@ -1,20 +1,38 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import re
 import shutil
-import statistics
 import sys
+import tarfile
 import threading
 import time
 import uuid
 from datetime import datetime, timezone
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any
 
 from .config import EvolutionConfig
-from .evaluator import SkillJudge, aggregate_scores, score_execution
-from .io_utils import ensure_dir, now_utc_stamp, run_shell_command, write_json
+from .evaluator import (
+    JUDGE_SKIPPED_VIOLATION,
+    SkillJudge,
+    aggregate_scores,
+    score_execution,
+    skipped_judge_result,
+)
+from .io_utils import (
+    JsonWriter,
+    decode_json,
+    encode_json,
+    ensure_dir,
+    ensure_dirs,
+    now_utc_stamp,
+    precompile_memoryctl,
+    run_shell_command,
+    write_bytes_atomic,
+)
 from .models import (
     Decision,
     EvaluationSnapshot,
@@ -25,12 +43,14 @@ from .models import (
     ScenarioResult,
 )
 from .mutator import Mutator
-from .opencode_client import OpenCodeClient
+from .opencode_client import OpenCodeClient, resolve_opencode_executable
 from .probe import MemoryProbe
 from .runner import ScenarioRunner
 from .scenarios import load_scenarios, select_batch
 from .synthesizer import ScenarioSynthesizer
 
+STOP_FILE_POLL_SECONDS = 1.0
+
 
 class EvolutionOrchestrator:
     def __init__(
@@ -42,6 +62,10 @@ class EvolutionOrchestrator:
         disable_mutation: bool = False,
         progress_enabled: bool = True,
         heartbeat_seconds: int = 15,
+        warm_start: bool = True,
+        evolution_timeout: float | None = None,
+        candidate_timeout: float | None = None,
+        resume_summary: dict[str, Any] | None = None,
     ) -> None:
         self.workspace_root = workspace_root
         self.config = config
@@ -49,11 +73,31 @@ class EvolutionOrchestrator:
         self.disable_mutation = disable_mutation
         self.progress_enabled = progress_enabled
         self.heartbeat_seconds = max(1, heartbeat_seconds)
+        self.warm_start = warm_start
+        self.resume_summary = resume_summary
+        self.evolution_timeout = evolution_timeout if evolution_timeout and evolution_timeout > 0 else None
+        self.candidate_timeout = candidate_timeout if candidate_timeout and candidate_timeout > 0 else None
+        # Shared by consecutive runs of the same configuration: each real run
+        # leaves its active snapshot's train failures here for the next run's
+        # baseline synthesis.
+        self.config_id = _config_identity(config)
+        self.warm_start_path = (
+            self.workspace_root / config.artifact_root / f"warm-start-{self.config_id[:12]}.json"
+        )
 
         self._activate_runtime_lane_allow_paths()
 
         self.run_id = f"{now_utc_stamp()}-{uuid.uuid4().hex[:8]}"
         self.run_dir = self.workspace_root / config.artifact_root / self.run_id
+        self._run_config_bytes = encode_json(
+            {
+                "run_id": self.run_id,
+                "workspace_root": str(self.workspace_root),
+                "config": self.config.to_dict(),
+                "dry_run": self.dry_run,
+                "disable_mutation": self.disable_mutation,
+            }
+        )
         self.progress_log_path = self.run_dir / "progress.jsonl"
         self.started_monotonic = time.monotonic()
         self._progress_lock = threading.Lock()
@@ -81,6 +125,8 @@ class EvolutionOrchestrator:
             self.workspace_root / "evo/prompts/scenario_synthesizer_contract.md"
         )
 
+        # The clients only differ in agent config; resolve the CLI once for all of them.
+        opencode_executable = resolve_opencode_executable()
         runner_client = OpenCodeClient(
             workspace_root,
             config.runner,
@@ -90,6 +136,7 @@ class EvolutionOrchestrator:
                 **payload,
             ),
             heartbeat_seconds=self.heartbeat_seconds,
+            executable=opencode_executable,
         )
         judge_client = OpenCodeClient(
             workspace_root,
@@ -100,6 +147,7 @@ class EvolutionOrchestrator:
                 **payload,
             ),
             heartbeat_seconds=self.heartbeat_seconds,
+            executable=opencode_executable,
         )
         mutator_client = OpenCodeClient(
             workspace_root,
@@ -110,6 +158,7 @@ class EvolutionOrchestrator:
                 **payload,
             ),
             heartbeat_seconds=self.heartbeat_seconds,
+            executable=opencode_executable,
         )
         synthesizer_client = OpenCodeClient(
             workspace_root,
@@ -120,6 +169,7 @@ class EvolutionOrchestrator:
                 **payload,
             ),
             heartbeat_seconds=self.heartbeat_seconds,
+            executable=opencode_executable,
         )
 
         self.runner = ScenarioRunner(
@@ -130,12 +180,18 @@ class EvolutionOrchestrator:
             export_sessions=config.export_sessions,
             progress_hook=lambda event, payload: self._progress(event, **payload),
             fallback_only=config.runner_fallback_only,
+            artifact_mode=config.runner_artifact_mode,
         )
         self.judge = SkillJudge(
             client=judge_client,
             judge_contract=judge_contract,
             workspace_root=workspace_root,
             skill_paths=config.skill_paths,
+            cache_dir=(
+                workspace_root / config.artifact_root / "judge-cache"
+                if config.judge_cache
+                else None
+            ),
         )
         self.mutator = Mutator(
             client=mutator_client,
@@ -152,8 +208,48 @@ class EvolutionOrchestrator:
             skill_paths=config.skill_paths,
         )
         self.probe = MemoryProbe(workspace_root)
+        precompile_memoryctl(workspace_root)
+        self.writer = JsonWriter()
+        self._recent_failures_cache: tuple[EvaluationSnapshot, list[dict[str, Any]]] | None = None
+        self._stop_event = threading.Event()
+        self._stop_cause = "stop-file-triggered"
+        self._stop_watch_done = threading.Event()
+        self._candidate_deadline: float | None = None
+        self._candidate_cut_short = False
 
     def run(self) -> dict[str, Any]:
+        self._stop_watch_done.clear()
+        watcher = threading.Thread(
+            target=self._watch_stop_file,
+            name="stop-file-watcher",
+            daemon=True,
+        )
+        watcher.start()
+        try:
+            return self._run()
+        finally:
+            self._stop_watch_done.set()
+            self.runner.join_exports()
+            self.writer.flush()
+
+    def _watch_stop_file(self) -> None:
+        stop_path = self.workspace_root / self.config.stop_file
+        deadline = (
+            self.started_monotonic + self.evolution_timeout
+            if self.evolution_timeout is not None
+            else None
+        )
+        while not self._stop_watch_done.wait(STOP_FILE_POLL_SECONDS):
+            if stop_path.exists():
+                self._stop_event.set()
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                # Unlike max_wall_seconds, this also cuts an epoch short.
+                self._stop_cause = "evolution-timeout-reached"
+                self._stop_event.set()
+                return
+
+    def _run(self) -> dict[str, Any]:
         ensure_dir(self.run_dir)
         ensure_dir(self.workspace_root / self.config.memory_run_root / self.run_id)
         self._progress(
@@ -178,16 +274,7 @@ class EvolutionOrchestrator:
         if not static_holdout:
             raise RuntimeError("No holdout scenarios found for evolution loop.")
 
-        write_json(
-            self.run_dir / "run-config.json",
-            {
-                "run_id": self.run_id,
-                "workspace_root": str(self.workspace_root),
-                "config": self.config.to_dict(),
-                "dry_run": self.dry_run,
-                "disable_mutation": self.disable_mutation,
-            },
-        )
+        write_bytes_atomic(self.run_dir / "run-config.json", self._run_config_bytes)
         self._progress(
             "scenario_pool_loaded",
             train_count=len(static_train),
@@ -198,7 +285,7 @@ class EvolutionOrchestrator:
             epoch=0,
             static_train=static_train,
             static_holdout=static_holdout,
-            recent_train_failures=[],
+            recent_train_failures=self._warm_start_failures(),
             epoch_dir=self.run_dir / "epoch-000",
         )
         baseline_train_pool = _merge_scenarios(static_train, baseline_synth_train)
@@ -215,22 +302,25 @@ class EvolutionOrchestrator:
             train_batch=baseline_train_batch,
             holdout_batch=baseline_holdout_batch,
         )
-        self._progress(
-            "baseline_complete",
-            train_score=baseline_snapshot.train_score,
-            holdout_score=baseline_snapshot.holdout_score,
-            hard_pass_rate=baseline_snapshot.hard_pass_rate,
-        )
-        write_json(
+        # A cut-short baseline is kept as the epoch-000 artifact but is never
+        # reported as the best snapshot or left behind for warm-start.
+        baseline_interrupted = self._stop_event.is_set()
+        if baseline_interrupted:
+            self._progress("baseline_interrupted", stop_reason=self._stop_cause)
+        else:
+            self._progress(
+                "baseline_complete",
+                train_score=baseline_snapshot.train_score,
+                holdout_score=baseline_snapshot.holdout_score,
+                hard_pass_rate=baseline_snapshot.hard_pass_rate,
+            )
+        self.writer.submit(
             self.run_dir / "epoch-000-baseline-summary.json",
             _snapshot_to_dict(baseline_snapshot),
         )
 
         active_snapshot = baseline_snapshot
-        recent_train_failures = _collect_recent_failures(
-            active_snapshot.scenario_results,
-            partition="train",
-        )
+        recent_train_failures = self._recent_train_failures(active_snapshot)
 
         history: list[dict[str, Any]] = []
         candidate_bank: list[dict[str, Any]] = []
@@ -239,9 +329,9 @@ class EvolutionOrchestrator:
         provisional_pending = False
         provisional_confirmations = 0
         epoch = 1
-        stop_reason = ""
+        stop_reason = self._stop_cause if baseline_interrupted else ""
         provider_blocked_streak = 0
-        baseline_blocked = self._is_provider_blocked_snapshot(baseline_snapshot)
+        baseline_blocked = not baseline_interrupted and self._is_provider_blocked_snapshot(baseline_snapshot)
         if baseline_blocked:
             provider_blocked_streak = 1
             rate = self._provider_blocked_rate(baseline_snapshot)
@@ -309,6 +399,9 @@ class EvolutionOrchestrator:
                 train_batch=control_train_batch,
                 holdout_batch=control_holdout_batch,
             )
+            if self._stop_event.is_set():
+                stop_reason = self._stop_cause
+                break
             self._progress(
                 "control_snapshot_complete",
                 epoch=epoch,
@@ -339,10 +432,7 @@ class EvolutionOrchestrator:
             ):
                 if self.config.objectives.stop_when_provider_blocked and not self.config.objectives.continue_on_provider_blocked:
                     active_snapshot = control_snapshot
-                    recent_train_failures = _collect_recent_failures(
-                        active_snapshot.scenario_results,
-                        partition="train",
-                    )
+                    recent_train_failures = self._recent_train_failures(active_snapshot)
                     history.append(
                         {
                             "epoch": epoch,
@@ -413,10 +503,7 @@ class EvolutionOrchestrator:
 
             if self.dry_run or self.disable_mutation:
                 active_snapshot = control_snapshot
-                recent_train_failures = _collect_recent_failures(
-                    active_snapshot.scenario_results,
-                    partition="train",
-                )
+                recent_train_failures = self._recent_train_failures(active_snapshot)
                 history.append(
                     {
                         "epoch": epoch,
@@ -448,10 +535,7 @@ class EvolutionOrchestrator:
                 else:
                     stagnant_epochs += 1
                 active_snapshot = control_snapshot
-                recent_train_failures = _collect_recent_failures(
-                    active_snapshot.scenario_results,
-                    partition="train",
-                )
+                recent_train_failures = self._recent_train_failures(active_snapshot)
                 history.append(
                     {
                         "epoch": epoch,
@@ -482,17 +566,17 @@ class EvolutionOrchestrator:
                     train_batch=decision_train_batch,
                     holdout_batch=decision_holdout_batch,
                 )
+                if self._stop_event.is_set():
+                    stop_reason = self._stop_cause
+                    break
 
             transaction = self.mutator.apply(proposal)
             if transaction.errors:
                 self.mutator.rollback(transaction)
                 stagnant_epochs += 1
                 active_snapshot = control_for_decision
-                recent_train_failures = _collect_recent_failures(
-                    active_snapshot.scenario_results,
-                    partition="train",
-                )
-                write_json(
+                recent_train_failures = self._recent_train_failures(active_snapshot)
+                self.writer.submit(
                     epoch_dir / "mutation-apply-errors.json",
                     {
                         "errors": transaction.errors,
@@ -519,15 +603,12 @@ class EvolutionOrchestrator:
                 proposal=proposal,
                 recent_failures=recent_train_failures,
             )
-            write_json(epoch_dir / "candidate-delta.json", candidate_delta)
+            self.writer.submit(epoch_dir / "candidate-delta.json", candidate_delta)
             if not candidate_delta["has_required_evolution_diff"]:
                 self.mutator.rollback(transaction)
                 stagnant_epochs += 1
                 active_snapshot = control_for_decision
-                recent_train_failures = _collect_recent_failures(
-                    active_snapshot.scenario_results,
-                    partition="train",
-                )
+                recent_train_failures = self._recent_train_failures(active_snapshot)
                 history.append(
                     {
                         "epoch": epoch,
@@ -546,15 +627,12 @@ class EvolutionOrchestrator:
                 continue
 
             gate_results = self._run_quality_gates(runtime_touched=runtime_touched)
-            write_json(epoch_dir / "quality-gates.json", gate_results)
+            self.writer.submit(epoch_dir / "quality-gates.json", gate_results)
             if gate_results["failed"]:
                 self.mutator.rollback(transaction)
                 stagnant_epochs += 1
                 active_snapshot = control_for_decision
-                recent_train_failures = _collect_recent_failures(
-                    active_snapshot.scenario_results,
-                    partition="train",
-                )
+                recent_train_failures = self._recent_train_failures(active_snapshot)
                 history.append(
                     {
                         "epoch": epoch,
@@ -570,12 +648,53 @@ class EvolutionOrchestrator:
                 epoch += 1
                 continue
 
+            if self.candidate_timeout is not None:
+                self._candidate_deadline = time.monotonic() + self.candidate_timeout
+            self._candidate_cut_short = False
+            # Degraded mode may accept provisionally despite hard failures,
+            # so the judge can only be skipped when _decide will reject.
             candidate_snapshot = self._evaluate_snapshot(
                 epoch=epoch,
                 label="candidate",
                 train_batch=decision_train_batch,
                 holdout_batch=decision_holdout_batch,
+                early_exit_on_hard_fail=(
+                    self.config.objectives.early_exit_on_hard_fail
+                    and not (
+                        provider_degraded_mode
+                        and self.config.objectives.allow_provisional_acceptance
+                    )
+                ),
             )
+            # Only a partition that actually skipped scenarios counts; a
+            # deadline passing during aggregation or judging does not.
+            candidate_timed_out = self._candidate_cut_short
+            self._candidate_deadline = None
+            if self._stop_event.is_set():
+                # A cut-short candidate snapshot cannot be judged fairly.
+                self.mutator.rollback(transaction)
+                stop_reason = self._stop_cause
+                break
+            if candidate_timed_out:
+                self.mutator.rollback(transaction)
+                stagnant_epochs += 1
+                active_snapshot = control_for_decision
+                recent_train_failures = self._recent_train_failures(active_snapshot)
+                history.append(
+                    {
+                        "epoch": epoch,
+                        "event": "rejected-candidate-timeout",
+                        "reason": f"candidate evaluation exceeded {self.candidate_timeout:g}s",
+                        "candidate_delta": candidate_delta,
+                    }
+                )
+                self._progress(
+                    "candidate_timeout",
+                    epoch=epoch,
+                    timeout_seconds=self.candidate_timeout,
+                )
+                epoch += 1
+                continue
             self._progress(
                 "candidate_snapshot_complete",
                 epoch=epoch,
@@ -608,26 +727,23 @@ class EvolutionOrchestrator:
                 "baseline_holdout_score": control_for_decision.holdout_score,
             }
             candidate_bank.append(candidate_bank_entry)
-            write_json(epoch_dir / "candidate-bank-entry.json", candidate_bank_entry)
+            self.writer.submit(epoch_dir / "candidate-bank-entry.json", candidate_bank_entry)
 
-            write_json(
+            self.writer.submit(
                 epoch_dir / "decision.json",
                 {
                     "decision": decision.__dict__,
                     "runtime_touched": runtime_touched,
                     "candidate_delta": candidate_delta,
                     "candidate": _snapshot_to_dict(candidate_snapshot),
-                    "baseline": _snapshot_to_dict(control_for_decision),
+                    "baseline_ref": _snapshot_summary_ref(control_for_decision),
                     "proposal": proposal.parsed_payload,
                 },
             )
 
             if decision.accepted:
                 active_snapshot = candidate_snapshot
-                recent_train_failures = _collect_recent_failures(
-                    active_snapshot.scenario_results,
-                    partition="train",
-                )
+                recent_train_failures = self._recent_train_failures(active_snapshot)
                 stagnant_epochs = 0
                 if decision.provisional:
                     provisional_accepts += 1
@@ -660,10 +776,7 @@ class EvolutionOrchestrator:
             else:
                 self.mutator.rollback(transaction)
                 active_snapshot = control_for_decision
-                recent_train_failures = _collect_recent_failures(
-                    active_snapshot.scenario_results,
-                    partition="train",
-                )
+                recent_train_failures = self._recent_train_failures(active_snapshot)
                 stagnant_epochs += 1
                 history.append(
                     {
@@ -691,7 +804,7 @@ class EvolutionOrchestrator:
         final_summary = {
             "run_id": self.run_id,
             "stop_reason": stop_reason,
-            "best_snapshot": _snapshot_to_dict(active_snapshot),
+            "best_snapshot": None if baseline_interrupted else _snapshot_to_dict(active_snapshot),
             "history": history,
             "candidate_bank_size": len(candidate_bank),
             "provisional_accepts": provisional_accepts,
@@ -700,24 +813,124 @@ class EvolutionOrchestrator:
             "stagnant_epochs": stagnant_epochs,
             "completed_epochs": max(0, epoch - 1),
         }
-        write_json(
+        self.writer.submit(
             self.run_dir / "candidate-bank.json",
             {
                 "run_id": self.run_id,
                 "entries": candidate_bank,
             },
         )
-        write_json(self.run_dir / "final-summary.json", final_summary)
+        self.writer.submit(self.run_dir / "final-summary.json", final_summary)
+        # Dry runs and fallback executions do not reflect real agent behavior,
+        # so they never seed a later run.
+        if not (
+            baseline_interrupted
+            or self.dry_run
+            or self.config.runner_fallback_only
+            or any(result.fallback_used for result in active_snapshot.scenario_results)
+        ):
+            self.writer.submit(
+                self.warm_start_path,
+                {
+                    "run_id": self.run_id,
+                    "config_id": self.config_id,
+                    "recent_train_failures": self._recent_train_failures(active_snapshot),
+                },
+            )
         self._progress(
             "run_finish",
             run_id=self.run_id,
             stop_reason=stop_reason,
             completed_epochs=max(0, epoch - 1),
-            final_train_score=active_snapshot.train_score,
-            final_holdout_score=active_snapshot.holdout_score,
+            final_train_score=None if baseline_interrupted else active_snapshot.train_score,
+            final_holdout_score=None if baseline_interrupted else active_snapshot.holdout_score,
         )
         return final_summary
 
+    def _warm_start_failures(self) -> list[dict[str, Any]]:
+        if self.resume_summary is not None:
+            return self._resume_failures(self.resume_summary)
+        if not self.warm_start:
+            return []
+        try:
+            payload = decode_json(self.warm_start_path.read_bytes())
+        except (OSError, ValueError):
+            return []
+        if not isinstance(payload, dict) or payload.get("config_id") != self.config_id:
+            return []
+        failures = payload.get("recent_train_failures")
+        if not isinstance(failures, list):
+            return []
+        failures = [item for item in failures if isinstance(item, dict)]
+        self._progress(
+            "warm_start_loaded",
+            source_run_id=payload.get("run_id"),
+            failure_count=len(failures),
+        )
+        return failures
+
+    def _resume_failures(self, summary: dict[str, Any]) -> list[dict[str, Any]]:
+        # Summaries from before scenario-result refs carry each result inline;
+        # newer ones are read back from the referenced scenario-result.json.
+        best = summary.get("best_snapshot")
+        entries = best.get("scenario_results") if isinstance(best, dict) else None
+        if not isinstance(entries, list):
+            self._progress(
+                "resume_summary_unusable",
+                source_run_id=summary.get("run_id"),
+                reason="summary has no best_snapshot.scenario_results list",
+            )
+            return []
+        failures: list[dict[str, Any]] = []
+        unreadable = 0
+        incomplete = 0
+        for entry in entries:
+            if not isinstance(entry, dict) or entry.get("partition") != "train":
+                continue
+            if "fitness" in entry:
+                result: dict[str, Any] | None = entry
+            else:
+                result = _read_scenario_result_ref(str(entry.get("artifact_ref") or ""))
+            if result is None:
+                unreadable += 1
+                continue
+            fitness = result.get("fitness")
+            hard_pass = result.get("hard_pass")
+            if not isinstance(fitness, (int, float)) or not isinstance(hard_pass, bool):
+                incomplete += 1
+                continue
+            failure = _recent_failure(
+                scenario_id=str(result.get("scenario_id", entry.get("scenario_id"))),
+                fitness=fitness,
+                hard_pass=hard_pass,
+                violations=result.get("violations", []),
+                next_focus=result.get("next_focus", []),
+            )
+            if failure is not None:
+                failures.append(failure)
+        if unreadable or incomplete:
+            self._progress(
+                "resume_summary_incomplete",
+                source_run_id=summary.get("run_id"),
+                unreadable_results=unreadable,
+                incomplete_results=incomplete,
+            )
+        self._progress(
+            "resume_summary_loaded",
+            source_run_id=summary.get("run_id"),
+            failure_count=len(failures),
+        )
+        return failures
+
+    def _recent_train_failures(self, snapshot: EvaluationSnapshot) -> list[dict[str, Any]]:
+        # The active snapshot is often unchanged across rejected epochs.
+        cached = self._recent_failures_cache
+        if cached is not None and cached[0] is snapshot:
+            return cached[1]
+        failures = _collect_recent_failures(snapshot.scenario_results, partition="train")
+        self._recent_failures_cache = (snapshot, failures)
+        return failures
+
     def _evaluate_snapshot(
         self,
         *,
@@ -725,9 +938,23 @@ class EvolutionOrchestrator:
         label: str,
         train_batch: list[Scenario],
         holdout_batch: list[Scenario],
+        early_exit_on_hard_fail: bool = False,
     ) -> EvaluationSnapshot:
         epoch_dir = self.run_dir / f"epoch-{epoch:03d}" / label
         ensure_dir(epoch_dir)
+        scenario_dirs: list[Path] = []
+        for partition, batch in (("train", train_batch), ("holdout", holdout_batch)):
+            for scenario in batch:
+                scenario_dirs.append(epoch_dir / partition / scenario.id)
+                scenario_dirs.append(
+                    self._memory_root(
+                        epoch=epoch,
+                        label=label,
+                        partition=partition,
+                        scenario_id=scenario.id,
+                    )
+                )
+        ensure_dirs(scenario_dirs)
         self._progress(
             "snapshot_start",
             epoch=epoch,
@@ -742,6 +969,7 @@ class EvolutionOrchestrator:
             label=label,
             scenarios=train_batch,
             epoch_dir=epoch_dir,
+            early_exit_on_hard_fail=early_exit_on_hard_fail,
         )
         holdout_results = self._run_partition(
             partition="holdout",
@@ -749,13 +977,30 @@ class EvolutionOrchestrator:
             label=label,
             scenarios=holdout_batch,
             epoch_dir=epoch_dir,
+            early_exit_on_hard_fail=early_exit_on_hard_fail,
+            hard_failed=early_exit_on_hard_fail
+            and not all(item.hard_pass for item in train_results),
         )
 
         train_score, train_hard = aggregate_scores(train_results)
         holdout_score, holdout_hard = aggregate_scores(holdout_results)
 
         all_results = [*train_results, *holdout_results]
-        _, hard_rate = aggregate_scores(all_results)
+        judge_total = 0.0
+        hard_count = 0
+        violations: dict[str, list[str]] = {}
+        next_focus: dict[str, list[str]] = {}
+        for item in all_results:
+            judge_total += item.judge_score
+            if item.hard_pass:
+                hard_count += 1
+            if item.violations:
+                violations[item.scenario_id] = item.violations
+            if item.next_focus:
+                next_focus[item.scenario_id] = item.next_focus
+        result_count = len(all_results)
+        hard_rate = hard_count / result_count if result_count else 0.0
+        mean_judge_score = judge_total / result_count if result_count else 0.0
         objective_metrics_all = _objective_metrics(all_results)
         objective_metrics_train = _objective_metrics(train_results)
         objective_metrics_holdout = _objective_metrics(holdout_results)
@@ -772,19 +1017,9 @@ class EvolutionOrchestrator:
             "train_score": train_score,
             "holdout_score": holdout_score,
             "hard_pass_rate": hard_rate,
-            "mean_judge_score": (
-                statistics.mean([item.judge_score for item in all_results]) if all_results else 0.0
-            ),
-            "violations": {
-                item.scenario_id: item.violations
-                for item in all_results
-                if item.violations
-            },
-            "next_focus": {
-                item.scenario_id: item.next_focus
-                for item in all_results
-                if item.next_focus
-            },
+            "mean_judge_score": mean_judge_score,
+            "violations": violations,
+            "next_focus": next_focus,
             "partition_hard_pass_rate": {
                 "train": train_hard,
                 "holdout": holdout_hard,
@@ -796,7 +1031,12 @@ class EvolutionOrchestrator:
             },
         }
 
-        write_json(epoch_dir / "snapshot-summary.json", summary)
+        self.writer.submit(epoch_dir / "snapshot-summary.json", summary)
+        if self.config.archive_scenarios:
+            # The archive must see every scenario file, so drain the writers first.
+            self.runner.join_exports()
+            self.writer.flush()
+            _archive_scenario_artifacts(epoch_dir, all_results)
         self._progress(
             "snapshot_finish",
             epoch=epoch,
@@ -816,6 +1056,24 @@ class EvolutionOrchestrator:
             summary=summary,
         )
 
+    def _memory_root(
+        self,
+        *,
+        epoch: int,
+        label: str,
+        partition: str,
+        scenario_id: str,
+    ) -> Path:
+        return (
+            self.workspace_root
+            / self.config.memory_run_root
+            / self.run_id
+            / f"epoch-{epoch:03d}"
+            / label
+            / partition
+            / scenario_id
+        )
+
     def _run_partition(
         self,
         *,
@@ -824,10 +1082,25 @@ class EvolutionOrchestrator:
         label: str,
         scenarios: list[Scenario],
         epoch_dir: Path,
+        early_exit_on_hard_fail: bool = False,
+        hard_failed: bool = False,
     ) -> list[ScenarioResult]:
         results: list[ScenarioResult] = []
         total = len(scenarios)
         for index, scenario in enumerate(scenarios, start=1):
+            interrupted = self._stop_event.is_set()
+            if not interrupted and self._candidate_deadline_passed():
+                self._candidate_cut_short = True
+                interrupted = True
+            if interrupted:
+                self._progress(
+                    "partition_interrupted",
+                    epoch=epoch,
+                    label=label,
+                    partition=partition,
+                    progress=f"{index - 1}/{total}",
+                )
+                break
             self._progress(
                 "scenario_start",
                 epoch=epoch,
@@ -837,14 +1110,11 @@ class EvolutionOrchestrator:
                 progress=f"{index}/{total}",
             )
             scenario_artifact = epoch_dir / partition / scenario.id
-            memory_root = (
-                self.workspace_root
-                / self.config.memory_run_root
-                / self.run_id
-                / f"epoch-{epoch:03d}"
-                / label
-                / partition
-                / scenario.id
+            memory_root = self._memory_root(
+                epoch=epoch,
+                label=label,
+                partition=partition,
+                scenario_id=scenario.id,
             )
 
             before_status = self._git_status_lines()
@@ -864,7 +1134,7 @@ class EvolutionOrchestrator:
             if workspace_delta:
                 self._revert_workspace_delta(workspace_delta)
                 self.runner.force_fallback_mode = True
-                write_json(
+                self.writer.submit(
                     scenario_artifact / "workspace-delta.json",
                     {
                         "detected": workspace_delta,
@@ -877,28 +1147,41 @@ class EvolutionOrchestrator:
                 scope=self.config.scope,
                 project=self.config.project,
             )
-            write_json(scenario_artifact / "memory-probe.json", probe_payload)
+            self.writer.submit(scenario_artifact / "memory-probe.json", probe_payload)
 
-            judge_payload = self.judge.score(
-                execution=execution,
-                probe=probe_payload,
-                artifact_dir=scenario_artifact,
-            )
+            if early_exit_on_hard_fail and (
+                hard_failed or workspace_delta or not probe_payload.get("hard_pass")
+            ):
+                # A hard failure already rules out acceptance; skip the judge.
+                hard_failed = True
+                scenario_result = skipped_judge_result(
+                    execution=execution,
+                    probe=probe_payload,
+                    reason=JUDGE_SKIPPED_VIOLATION,
+                )
+            else:
+                judge_payload = self.judge.score(
+                    execution=execution,
+                    probe=probe_payload,
+                    artifact_dir=scenario_artifact,
+                )
 
-            hydration_required = (
-                self.config.skill_hydration.required_paths
-                if self.config.skill_hydration.required_paths
-                else self.config.skill_paths[:1]
-            )
-            scenario_result = score_execution(
-                execution=execution,
-                probe=probe_payload,
-                judge_payload=judge_payload,
-                required_skill_paths=hydration_required,
-                minimum_skill_reads=self.config.skill_hydration.minimum_reads,
-                enforce_skill_hydration=self.config.skill_hydration.enforce,
-                hard_fail_missing_skills=self.config.skill_hydration.hard_fail_missing,
-            )
+                hydration_required = (
+                    self.config.skill_hydration.required_paths
+                    if self.config.skill_hydration.required_paths
+                    else self.config.skill_paths[:1]
+                )
+                scenario_result = score_execution(
+                    execution=execution,
+                    probe=probe_payload,
+                    judge_payload=judge_payload,
+                    required_skill_paths=hydration_required,
+                    minimum_skill_reads=self.config.skill_hydration.minimum_reads,
+                    enforce_skill_hydration=self.config.skill_hydration.enforce,
+                    hard_fail_missing_skills=self.config.skill_hydration.hard_fail_missing,
+                )
+                if early_exit_on_hard_fail and not scenario_result.hard_pass:
+                    hard_failed = True
             if workspace_delta:
                 scenario_result.hard_pass = False
                 scenario_result.fitness = 0.0
@@ -910,7 +1193,7 @@ class EvolutionOrchestrator:
                     scenario_result.violations.append(
                         "Workspace delta preview: " + preview
                     )
-            write_json(
+            self.writer.submit(
                 scenario_artifact / "scenario-result.json",
                 _scenario_result_to_dict(scenario_result),
             )
@@ -1125,6 +1408,14 @@ class EvolutionOrchestrator:
             min_fallback_reduction=self.config.objectives.min_fallback_reduction,
             max_fallback_increase=self.config.objectives.max_fallback_increase,
         )
+        common: dict[str, Any] = {
+            "candidate_train_score": candidate.train_score,
+            "candidate_holdout_score": candidate.holdout_score,
+            "baseline_train_score": baseline.train_score,
+            "baseline_holdout_score": baseline.holdout_score,
+            "candidate_hard_pass_rate": candidate.hard_pass_rate,
+            "objective_progress": objective_progress,
+        }
 
         if degraded_provider_mode and self.config.objectives.allow_provisional_acceptance:
             return self._decide_degraded(
@@ -1139,60 +1430,42 @@ class EvolutionOrchestrator:
             return Decision(
                 accepted=False,
                 reason="candidate has no meaningful skill/runtime diff",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
             )
 
         if not objective_progress["fallback_gate_ok"]:
             return Decision(
                 accepted=False,
                 reason="candidate increased fallback dependency",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
             )
 
         if not objective_progress["provider_block_gate_ok"]:
             return Decision(
                 accepted=False,
                 reason="candidate increased provider-blocked executions",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
+            )
+
+        if _judge_skipped(candidate):
+            return Decision(
+                accepted=False,
+                reason="candidate failed hard memory integrity gates; judging was skipped",
+                **common,
             )
 
         if not objective_progress["dimension_floor_ok"]:
             return Decision(
                 accepted=False,
                 reason="candidate regressed core complexity dimensions",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
             )
 
         if candidate.hard_pass_rate < 1.0:
             return Decision(
                 accepted=False,
                 reason="candidate failed hard memory integrity gates",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
             )
 
         holdout_floor = (
@@ -1202,12 +1475,7 @@ class EvolutionOrchestrator:
             return Decision(
                 accepted=False,
                 reason="candidate regressed holdout score",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
             )
 
         if self.config.objectives.require_objective_gain and not objective_progress[
@@ -1216,12 +1484,7 @@ class EvolutionOrchestrator:
             return Decision(
                 accepted=False,
                 reason="candidate did not improve core objective metrics",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
             )
 
         required_delta = (
@@ -1235,35 +1498,20 @@ class EvolutionOrchestrator:
             return Decision(
                 accepted=True,
                 reason="candidate improved score while preserving hard gates",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
             )
 
         if objective_progress["has_objective_gain"]:
             return Decision(
                 accepted=True,
                 reason="candidate improved core objective metrics while preserving hard gates",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
             )
 
         return Decision(
             accepted=False,
             reason="candidate did not improve enough",
-            candidate_train_score=candidate.train_score,
-            candidate_holdout_score=candidate.holdout_score,
-            baseline_train_score=baseline.train_score,
-            baseline_holdout_score=baseline.holdout_score,
-            candidate_hard_pass_rate=candidate.hard_pass_rate,
-            objective_progress=objective_progress,
+            **common,
         )
 
     def _decide_degraded(
@@ -1275,16 +1523,20 @@ class EvolutionOrchestrator:
         objective_progress: dict[str, Any],
         provisional_accepts: int,
     ) -> Decision:
+        common: dict[str, Any] = {
+            "candidate_train_score": candidate.train_score,
+            "candidate_holdout_score": candidate.holdout_score,
+            "baseline_train_score": baseline.train_score,
+            "baseline_holdout_score": baseline.holdout_score,
+            "candidate_hard_pass_rate": candidate.hard_pass_rate,
+            "objective_progress": objective_progress,
+        }
+
         if provisional_accepts >= self.config.objectives.max_provisional_accepts_per_run:
             return Decision(
                 accepted=False,
                 reason="provisional acceptance budget exhausted for this run",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
                 provisional=True,
             )
 
@@ -1292,12 +1544,7 @@ class EvolutionOrchestrator:
             return Decision(
                 accepted=False,
                 reason="candidate has no meaningful skill/runtime diff",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
                 provisional=True,
             )
 
@@ -1305,12 +1552,7 @@ class EvolutionOrchestrator:
             return Decision(
                 accepted=False,
                 reason="candidate did not modify actively hydrated skill surfaces",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
                 provisional=True,
             )
 
@@ -1319,12 +1561,7 @@ class EvolutionOrchestrator:
             return Decision(
                 accepted=False,
                 reason="candidate did not align sufficiently with observed failure clusters",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
                 provisional=True,
             )
 
@@ -1332,12 +1569,7 @@ class EvolutionOrchestrator:
             return Decision(
                 accepted=False,
                 reason="candidate increased fallback dependency",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
                 provisional=True,
             )
 
@@ -1345,12 +1577,15 @@ class EvolutionOrchestrator:
             return Decision(
                 accepted=False,
                 reason="candidate increased provider-blocked executions",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
+                provisional=True,
+            )
+
+        if _judge_skipped(candidate):
+            return Decision(
+                accepted=False,
+                reason="candidate failed hard memory integrity gates; judging was skipped",
+                **common,
                 provisional=True,
             )
 
@@ -1358,12 +1593,7 @@ class EvolutionOrchestrator:
             return Decision(
                 accepted=False,
                 reason="candidate regressed core complexity dimensions",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
                 provisional=True,
             )
 
@@ -1374,24 +1604,14 @@ class EvolutionOrchestrator:
             return Decision(
                 accepted=False,
                 reason="candidate did not improve objective signals in degraded mode",
-                candidate_train_score=candidate.train_score,
-                candidate_holdout_score=candidate.holdout_score,
-                baseline_train_score=baseline.train_score,
-                baseline_holdout_score=baseline.holdout_score,
-                candidate_hard_pass_rate=candidate.hard_pass_rate,
-                objective_progress=objective_progress,
+                **common,
                 provisional=True,
             )
 
         return Decision(
             accepted=True,
             reason="provisional acceptance under provider-blocked degraded mode",
-            candidate_train_score=candidate.train_score,
-            candidate_holdout_score=candidate.holdout_score,
-            baseline_train_score=baseline.train_score,
-            baseline_holdout_score=baseline.holdout_score,
-            candidate_hard_pass_rate=candidate.hard_pass_rate,
-            objective_progress=objective_progress,
+            **common,
             provisional=True,
         )
 
@@ -1651,7 +1871,7 @@ class EvolutionOrchestrator:
                 return "max-epochs-reached"
 
         if self._stop_file_exists():
-            return "stop-file-triggered"
+            return self._stop_cause
 
         if self.config.max_wall_seconds > 0:
             elapsed = int(time.monotonic() - self.started_monotonic)
@@ -1688,7 +1908,13 @@ class EvolutionOrchestrator:
                 self.config.mutation.allow_paths.append(path)
 
     def _stop_file_exists(self) -> bool:
-        return (self.workspace_root / self.config.stop_file).exists()
+        if not self._stop_event.is_set() and (self.workspace_root / self.config.stop_file).exists():
+            self._stop_event.set()
+        return self._stop_event.is_set()
+
+    def _candidate_deadline_passed(self) -> bool:
+        deadline = self._candidate_deadline
+        return deadline is not None and time.monotonic() >= deadline
 
     def _git_status_lines(self) -> set[str]:
         result = run_shell_command("git status --porcelain", cwd=self.workspace_root)
@@ -1718,6 +1944,16 @@ class EvolutionOrchestrator:
             )
 
 
+def _config_identity(config: EvolutionConfig) -> str:
+    # Run limits only decide when a run stops, not what it learns.
+    payload = {
+        key: value
+        for key, value in config.to_dict().items()
+        if key not in {"max_epochs", "max_stagnant_epochs", "continuous", "max_wall_seconds", "stop_file"}
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=True).encode("utf-8")).hexdigest()
+
+
 def _snapshot_to_dict(snapshot: EvaluationSnapshot) -> dict[str, Any]:
     return {
         "epoch": snapshot.epoch,
@@ -1726,10 +1962,71 @@ def _snapshot_to_dict(snapshot: EvaluationSnapshot) -> dict[str, Any]:
         "holdout_score": snapshot.holdout_score,
         "hard_pass_rate": snapshot.hard_pass_rate,
         "summary": snapshot.summary,
-        "scenario_results": [_scenario_result_to_dict(item) for item in snapshot.scenario_results],
+        "scenario_results": [_scenario_result_ref(item) for item in snapshot.scenario_results],
+    }
+
+
+def _archive_scenario_artifacts(epoch_dir: Path, results: list[ScenarioResult]) -> None:
+    archive_path = epoch_dir / "scenarios.tar"
+    archived: list[Path] = []
+    with tarfile.open(archive_path, "w") as archive:
+        for result in results:
+            scenario_dir = Path(result.artifact_dir)
+            if not scenario_dir.is_dir():
+                continue
+            arcname = scenario_dir.relative_to(epoch_dir).as_posix()
+            archive.add(scenario_dir, arcname=arcname)
+            archived.append(scenario_dir)
+            result.artifact_dir = f"{archive_path}#{arcname}"
+
+    for scenario_dir in archived:
+        shutil.rmtree(scenario_dir, ignore_errors=True)
+        try:
+            scenario_dir.parent.rmdir()
+        except OSError:
+            pass
+
+
+def _snapshot_summary_ref(snapshot: EvaluationSnapshot) -> str:
+    # Relative to the run dir; _evaluate_snapshot writes this file for every snapshot.
+    return f"epoch-{snapshot.epoch:03d}/{snapshot.label}/snapshot-summary.json"
+
+
+def _scenario_result_ref(result: ScenarioResult) -> dict[str, Any]:
+    # Full results already live in each scenario's scenario-result.json.
+    return {
+        "scenario_id": result.scenario_id,
+        "partition": result.partition,
+        "artifact_ref": _scenario_result_path(result.artifact_dir),
     }
 
 
+def _scenario_result_path(artifact_dir: str) -> str:
+    # Tar member names are always POSIX, even where Path joins with backslashes.
+    archive_path, sep, member = artifact_dir.partition("#")
+    if sep:
+        return f"{archive_path}#{PurePosixPath(member) / 'scenario-result.json'}"
+    return str(Path(artifact_dir) / "scenario-result.json")
+
+
+def _read_scenario_result_ref(artifact_ref: str) -> dict[str, Any] | None:
+    # Archived refs look like "<epoch>/scenarios.tar#<partition>/<id>/scenario-result.json".
+    archive_path, sep, member = artifact_ref.partition("#")
+    try:
+        if sep:
+            with tarfile.open(archive_path) as archive:
+                handle = archive.extractfile(member.replace("\\", "/"))
+                if handle is None:
+                    return None
+                data = handle.read()
+        else:
+            data = Path(artifact_ref).read_bytes()
+        payload = decode_json(data)
+    except (OSError, KeyError, ValueError, tarfile.TarError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
 def _scenario_result_to_dict(result: ScenarioResult) -> dict[str, Any]:
     return {
         "scenario_id": result.scenario_id,
@@ -1763,20 +2060,46 @@ def _collect_recent_failures(
     for item in results:
         if item.partition != partition:
             continue
-        if item.hard_pass and item.fitness > 80:
-            continue
-        failures.append(
-            {
-                "scenario_id": item.scenario_id,
-                "fitness": item.fitness,
-                "hard_pass": item.hard_pass,
-                "violations": item.violations,
-                "next_focus": item.next_focus,
-            }
+        failure = _recent_failure(
+            scenario_id=item.scenario_id,
+            fitness=item.fitness,
+            hard_pass=item.hard_pass,
+            violations=item.violations,
+            next_focus=item.next_focus,
         )
+        if failure is not None:
+            failures.append(failure)
     return failures
 
 
+def _recent_failure(
+    *,
+    scenario_id: str,
+    fitness: float,
+    hard_pass: bool,
+    violations: list[str],
+    next_focus: list[str],
+) -> dict[str, Any] | None:
+    # Shared by live snapshots and resumed summaries; None for a clean pass.
+    if hard_pass and fitness > 80:
+        return None
+    return {
+        "scenario_id": scenario_id,
+        "fitness": fitness,
+        "hard_pass": hard_pass,
+        "violations": violations,
+        "next_focus": next_focus,
+    }
+
+
+
+def _judge_skipped(snapshot: EvaluationSnapshot) -> bool:
+    # Skipped results carry zeroed dimensions, so name the hard gate instead.
+    return any(
+        JUDGE_SKIPPED_VIOLATION in item.violations for item in snapshot.scenario_results
+    )
+
+
 def _merge_scenarios(static_pool: list[Scenario], synthetic_pool: list[Scenario]) -> list[Scenario]:
     merged: list[Scenario] = []
     seen: set[str] = set()
@@ -1789,7 +2112,14 @@ def _merge_scenarios(static_pool: list[Scenario], synthetic_pool: list[Scenario]
 
 
 def _read_text(path: Path) -> str:
-    return path.read_text(encoding="utf-8")
+    resolved = path.resolve()
+    return _read_text_cached(str(resolved), resolved.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_text_cached(path: str, mtime_ns: int) -> str:
+    # mtime_ns is part of the cache key so edited contracts are re-read.
+    return Path(path).read_text(encoding="utf-8")
 
 
 def _is_stable_snapshot(snapshot: EvaluationSnapshot) -> bool:
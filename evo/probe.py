@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from .io_utils import extract_json_payload, run_command
+from .io_utils import extract_json_payload, memoryctl_process_args, run_command
 
 
 class MemoryProbe:
@@ -18,48 +19,82 @@ class MemoryProbe:
         scope: str,
         project: str,
     ) -> dict[str, Any]:
-        results: dict[str, Any] = {}
-
-        results["stats"] = self._memoryctl_json(
-            [
+        probe_specs: list[tuple[str, list[str]]] = [
+            (
                 "stats",
-                "--root",
-                str(memory_root),
-                "--scope",
-                scope,
-            ],
-        )
-        results["validate_strict"] = self._memoryctl_json(
-            [
-                "validate",
-                "--root",
-                str(memory_root),
-                "--strict",
-            ],
-        )
-        results["diagnose_dry_run"] = self._memoryctl_json(
+                [
+                    "stats",
+                    "--root",
+                    str(memory_root),
+                    "--scope",
+                    scope,
+                ],
+            ),
+            (
+                "validate_strict",
+                [
+                    "validate",
+                    "--root",
+                    str(memory_root),
+                    "--strict",
+                ],
+            ),
+            (
+                "diagnose_dry_run",
+                [
+                    "diagnose",
+                    "--root",
+                    str(memory_root),
+                    "--scope",
+                    scope,
+                    "--project",
+                    project,
+                    "--dry-run",
+                ],
+            ),
+            (
+                "optimize_dry_run",
+                [
+                    "optimize",
+                    "--root",
+                    str(memory_root),
+                    "--max-actions",
+                    "5",
+                    "--dry-run",
+                ],
+            ),
+        ]
+
+        batched = self._memoryctl_json(
             [
-                "diagnose",
+                "probe",
                 "--root",
                 str(memory_root),
                 "--scope",
                 scope,
                 "--project",
                 project,
-                "--dry-run",
-            ],
-        )
-        results["optimize_dry_run"] = self._memoryctl_json(
-            [
-                "optimize",
-                "--root",
-                str(memory_root),
                 "--max-actions",
                 "5",
-                "--dry-run",
-            ],
+            ]
         )
 
+        results: dict[str, Any] = {}
+        if all(isinstance(batched.get(key), dict) for key, _ in probe_specs):
+            for key, _ in probe_specs:
+                results[key] = batched[key]
+        else:
+            # Older or mutated memoryctl builds may lack `probe`; fall back to
+            # the individual read-only commands, run side by side.
+            with ThreadPoolExecutor(max_workers=len(probe_specs)) as executor:
+                payloads = list(
+                    executor.map(
+                        self._memoryctl_json, [args for _, args in probe_specs]
+                    )
+                )
+            for (key, _), payload in zip(probe_specs, payloads):
+                results[key] = payload
+
         validate = results.get("validate_strict", {})
         validate_ok = bool(validate.get("ok"))
         error_count = int(validate.get("error_count", 1))
@@ -69,11 +104,13 @@ class MemoryProbe:
 
     def _memoryctl_json(self, args: list[str]) -> dict[str, Any]:
         command = run_command(
-            args=[
-                "python",
-                ".opencode/skills/diasync-memory/scripts/memoryctl.py",
-                *args,
-            ],
+            args=memoryctl_process_args(
+                [
+                    "python",
+                    ".opencode/skills/diasync-memory/scripts/memoryctl.py",
+                    *args,
+                ]
+            ),
             cwd=self.workspace_root,
             timeout_seconds=120,
         )
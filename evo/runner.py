@@ -1,13 +1,219 @@
 from __future__ import annotations
 
+import functools
+import itertools
+import json
+import os
+import queue
+import random
+import re
+import stat
+import subprocess
+import threading
 import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable
-
-from .io_utils import ensure_dir, run_command, write_json
+from typing import Any, BinaryIO, Callable
+
+from .io_utils import (
+    CommandResult,
+    JsonWriter,
+    encode_json_line,
+    ensure_dir,
+    memoryctl_process_args,
+    run_command,
+    write_json,
+)
 from .models import RunEvents, Scenario, ScenarioExecution
 from .opencode_client import OpenCodeClient
-from .scenarios import render_text
+from .scenarios import compile_text, render_text
+
+
+TURN_ARTIFACT_MODES = ("per-turn", "jsonl")
+# Every marker _detect_provider_blocks looks for, found in one pass per text.
+PROVIDER_BLOCK_MARKERS_RE = re.compile(
+    r"insufficient_quota|total_cost_limit_exceeded|payment required|invalid_api_key"
+    r"|authentication|failed"
+)
+# Transient-error marker -> reason, matched in one pass per text.
+TRANSIENT_ERROR_REASONS = {
+    "too many requests": "rate_limit",
+    "rate limit": "rate_limit",
+    "temporarily unavailable": "service_unavailable",
+    "service unavailable": "service_unavailable",
+    "timed out": "timeout",
+    "timeout": "timeout",
+    "connection reset": "connection_reset",
+    "econnreset": "connection_reset",
+    "network error": "network_error",
+    "upstream": "network_error",
+}
+TRANSIENT_ERROR_MARKERS_RE = re.compile("|".join(map(re.escape, TRANSIENT_ERROR_REASONS)))
+NEW_SESSION_DIRECTIVE_RE = re.compile(
+    r"\s*(?:\[\[NEW_SESSION\]\]|\[NEW_SESSION\]|@new_session)[ :\n\t]*"
+)
+
+
+class _TurnArtifacts:
+    """Per-scenario sink for turn artifacts.
+
+    ``per-turn`` keeps one JSON file per artifact, written on the runner's
+    background writer; ``jsonl`` appends every artifact to a single
+    ``turns.jsonl`` opened once per scenario.
+    """
+
+    def __init__(self, artifact_dir: Path, *, mode: str, writer: JsonWriter) -> None:
+        self.artifact_dir = artifact_dir
+        self.mode = mode
+        self._writer = writer
+        # Artifact names are joined as strings; no Path object per write.
+        self._prefix = os.fspath(artifact_dir) + os.sep
+        self._handle: BinaryIO | None = None
+
+    def write(self, name: str, kind: str, payload: dict[str, Any]) -> None:
+        if self.mode == "per-turn":
+            self._writer.submit(self._prefix + name, payload)
+            return
+        if self._handle is None:
+            self._handle = open(self._prefix + "turns.jsonl", "ab", buffering=1 << 20)
+        record = {"artifact": name, "kind": kind, **payload}
+        self._handle.write(encode_json_line(record))
+
+    def close(self) -> None:
+        if self.mode == "per-turn":
+            self._writer.flush()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class _MemoryctlServer:
+    """Per-scenario ``memoryctl.py serve`` worker fed one argv per line.
+
+    Falls back to spawning each command when the worker cannot start (for
+    example an older memoryctl build without ``serve``) or has died.
+    """
+
+    ready_timeout_seconds = 10.0
+
+    def __init__(self, workspace_root: Path) -> None:
+        self.workspace_root = workspace_root
+        self._process: subprocess.Popen[bytes] | None = None
+        self._responses: queue.Queue[bytes | None] = queue.Queue()
+        self._failed = False
+
+    def run(self, args: list[str], *, timeout_seconds: int) -> CommandResult:
+        if self._failed or not self._start(args):
+            return run_command(
+                args=memoryctl_process_args(args),
+                cwd=self.workspace_root,
+                timeout_seconds=timeout_seconds,
+            )
+        process = self._process
+        assert process is not None and process.stdin is not None
+        try:
+            process.stdin.write(encode_json_line({"argv": args[2:]}))
+            process.stdin.flush()
+        except OSError:
+            # Nothing reached the worker, so the command can still run once.
+            self._abandon()
+            return run_command(
+                args=memoryctl_process_args(args),
+                cwd=self.workspace_root,
+                timeout_seconds=timeout_seconds,
+            )
+
+        try:
+            line = self._responses.get(timeout=timeout_seconds)
+        except queue.Empty:
+            self._abandon()
+            return CommandResult(args=args, exit_code=124, stdout="", stderr="Command timed out.")
+        if line is None:
+            self._abandon()
+            return CommandResult(
+                args=args,
+                exit_code=1,
+                stdout="",
+                stderr="memoryctl serve exited before responding.",
+            )
+        try:
+            response = json.loads(line)
+        except ValueError:
+            self._abandon()
+            return CommandResult(
+                args=args,
+                exit_code=1,
+                stdout=line.decode("utf-8", errors="replace"),
+                stderr="memoryctl serve returned a malformed response.",
+            )
+        return CommandResult(
+            args=args,
+            exit_code=int(response.get("exit_code", 1)),
+            stdout=str(response.get("stdout", "")),
+            stderr=str(response.get("stderr", "")),
+        )
+
+    def close(self) -> None:
+        process = self._process
+        if process is None:
+            return
+        self._process = None
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
+    def _start(self, args: list[str]) -> bool:
+        if self._process is not None:
+            return True
+        try:
+            process = subprocess.Popen(
+                memoryctl_process_args([args[0], args[1], "serve"]),
+                cwd=self.workspace_root,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            self._failed = True
+            return False
+        self._process = process
+        threading.Thread(
+            target=self._read_responses,
+            args=(process,),
+            name="memoryctl-serve",
+            daemon=True,
+        ).start()
+        try:
+            ready = self._responses.get(timeout=self.ready_timeout_seconds)
+        except queue.Empty:
+            ready = None
+        try:
+            is_ready = ready is not None and json.loads(ready).get("ready") is True
+        except (ValueError, AttributeError):
+            is_ready = False
+        if not is_ready:
+            self._abandon()
+            return False
+        return True
+
+    def _read_responses(self, process: subprocess.Popen[bytes]) -> None:
+        assert process.stdout is not None
+        for line in process.stdout:
+            self._responses.put(line)
+        self._responses.put(None)
+
+    def _abandon(self) -> None:
+        self._failed = True
+        process = self._process
+        self._process = None
+        if process is not None:
+            process.kill()
+            process.wait()
 
 
 class ScenarioRunner:
@@ -21,11 +227,15 @@ class ScenarioRunner:
         export_sessions: bool = True,
         progress_hook: Callable[[str, dict[str, Any]], None] | None = None,
         fallback_only: bool = False,
+        artifact_mode: str = "per-turn",
     ) -> None:
         self.client = client
         self.workspace_root = workspace_root
         self.runner_contract = runner_contract
+        self._contract_template = compile_text(runner_contract)
         self.skill_paths = skill_paths
+        self._skill_manifest = "\n".join(f"- {path}" for path in skill_paths)
+        self._skill_path_suffixes = [(path, _normalize_path(path)) for path in skill_paths]
         self.export_sessions = export_sessions
         self.progress_hook = progress_hook
         self.hydration_timeout_seconds = 20
@@ -33,6 +243,19 @@ class ScenarioRunner:
         self.force_fallback_mode = fallback_only
         self.provider_retry_attempts = 3
         self.provider_retry_backoff_seconds = 2.0
+        self.provider_retry_backoff_max_seconds = 30.0
+        if artifact_mode not in TURN_ARTIFACT_MODES:
+            raise ValueError(f"Unsupported artifact_mode: {artifact_mode}")
+        self.artifact_mode = artifact_mode
+        self._writer = JsonWriter()
+        self._dirs_seen: set[str] = set()
+        self._restored_skill_files: dict[str, tuple[int, str]] = {}
+        self._export_pool = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix="session-export",
+        )
+        self._export_futures: list[Future[None]] = []
+        self._export_lock = threading.Lock()
 
     def execute(
         self,
@@ -45,25 +268,69 @@ class ScenarioRunner:
         project: str,
         scope: str,
     ) -> ScenarioExecution:
-        self._progress(
-            "scenario_execute_start",
-            {
-                "scenario_id": scenario.id,
-                "partition": partition,
-                "epoch": epoch,
-                "turn_count": len(scenario.turns),
-            },
-        )
-        ensure_dir(memory_root)
-        ensure_dir(artifact_dir)
+        artifacts = _TurnArtifacts(artifact_dir, mode=self.artifact_mode, writer=self._writer)
+        memoryctl = _MemoryctlServer(self.workspace_root)
+        try:
+            return self._execute(
+                scenario=scenario,
+                partition=partition,
+                epoch=epoch,
+                memory_root=memory_root,
+                artifact_dir=artifact_dir,
+                project=project,
+                scope=scope,
+                artifacts=artifacts,
+                memoryctl=memoryctl,
+            )
+        finally:
+            memoryctl.close()
+            artifacts.close()
+
+    def _ensure_dir_once(self, path: Path) -> None:
+        key = os.fspath(path)
+        if key not in self._dirs_seen:
+            ensure_dir(path)
+            self._dirs_seen.add(key)
+
+    def _execute(
+        self,
+        *,
+        scenario: Scenario,
+        partition: str,
+        epoch: int,
+        memory_root: Path,
+        artifact_dir: Path,
+        project: str,
+        scope: str,
+        artifacts: _TurnArtifacts,
+        memoryctl: _MemoryctlServer,
+    ) -> ScenarioExecution:
+        # Bound once so event payloads are only built when someone listens.
+        progress_hook = self.progress_hook
+        if progress_hook is not None:
+            progress_hook(
+                "scenario_execute_start",
+                {
+                    "scenario_id": scenario.id,
+                    "partition": partition,
+                    "epoch": epoch,
+                    "turn_count": len(scenario.turns),
+                },
+            )
+        self._ensure_dir_once(memory_root)
+        self._ensure_dir_once(artifact_dir)
 
         session_id: str | None = None
-        session_ids: list[str] = []
+        # Insertion-ordered set of every session the scenario touched.
+        session_ids: dict[str, None] = {}
         turns: list[RunEvents] = []
-        assistant_messages: list[str] = []
+        # Per-run text lists, flattened once when the scenario finishes.
+        assistant_text_batches: list[list[str]] = []
         command_trace: list[str] = []
-        read_paths: list[str] = []
-        seen_reads: set[str] = set()
+        memoryctl_total = 0
+        trace_audit = _CommandAudit(memory_root=memory_root, scope=scope)
+        # Insertion-ordered set of normalized skill reads.
+        read_paths: dict[str, None] = {}
         fallback_only_mode = self.force_fallback_mode
         fallback_used = False
         provider_blocked = False
@@ -77,29 +344,99 @@ class ScenarioRunner:
             "scenario_id": scenario.id,
             "scenario_title": scenario.title,
             "scenario_description": scenario.description,
-            "skill_manifest": "\n".join(f"- {path}" for path in self.skill_paths),
+            "skill_manifest": self._skill_manifest,
             "success_criteria": "\n".join(
                 f"- {criterion}" for criterion in scenario.success_criteria
             ),
         }
-
-        for turn_index, turn_template in enumerate(scenario.turns):
-            self._progress(
-                "scenario_turn_start",
+        # `variables` is fixed for the scenario, so each distinct template and
+        # the contract header only need rendering once.
+        rendered_turns: dict[str, str] = {}
+        contract_header: str | None = None
+
+        def finish_fallback_turn(
+            turn_index: int,
+            turn_text: str,
+            new_session_turn: bool,
+            *,
+            prompt_label: str,
+            blocked: bool,
+        ) -> None:
+            # Shared by fallback-only turns and provider fast-fallback turns.
+            nonlocal memoryctl_total
+            fallback_record = self._execute_turn_fallback(
+                scenario=scenario,
+                epoch=epoch,
+                turn_index=turn_index,
+                total_turns=len(scenario.turns),
+                memory_root=memory_root,
+                scope=scope,
+                project=project,
+                turn_text=turn_text,
+                new_session_turn=new_session_turn,
+                memoryctl=memoryctl,
+            )
+            fallback_session = fallback_record.get("session_id")
+            if isinstance(fallback_session, str):
+                session_ids[fallback_session] = None
+            command_trace.extend(fallback_record["command_trace"])
+            memoryctl_total += _count_memoryctl_commands(fallback_record["command_trace"])
+            audit = trace_audit.update(command_trace)
+            artifacts.write(
+                f"turn-{turn_index + 1:02d}-events.json",
+                "events",
                 {
-                    "scenario_id": scenario.id,
-                    "partition": partition,
-                    "epoch": epoch,
-                    "turn_index": turn_index + 1,
-                    "turn_total": len(scenario.turns),
+                    "session_id": session_id,
+                    "prompt": prompt_label,
+                    "stdout": "",
+                    "stderr": "",
+                    "exit_code": 0,
+                    "events": [],
+                    "texts": [],
+                    "tool_commands": [],
+                    "audit": audit,
+                    "fallback_execution": fallback_record,
+                    "compliance_repair": None,
+                    "provider_blocked": blocked,
+                    "provider_block_reasons": sorted(provider_block_reasons) if blocked else [],
                 },
             )
+            if progress_hook is not None:
+                progress_hook(
+                    "scenario_turn_finish",
+                    {
+                        "scenario_id": scenario.id,
+                        "partition": partition,
+                        "epoch": epoch,
+                        "turn_index": turn_index + 1,
+                        "turn_total": len(scenario.turns),
+                        "memoryctl_commands": len(fallback_record["command_trace"]),
+                        "root_hits": audit["root_hits"],
+                        "scope_hits": audit["scope_hits"],
+                    },
+                )
+
+        for turn_index, turn_template in enumerate(scenario.turns):
+            if progress_hook is not None:
+                progress_hook(
+                    "scenario_turn_start",
+                    {
+                        "scenario_id": scenario.id,
+                        "partition": partition,
+                        "epoch": epoch,
+                        "turn_index": turn_index + 1,
+                        "turn_total": len(scenario.turns),
+                    },
+                )
             force_new_session, cleaned_template = _parse_turn_directive(turn_template)
             if force_new_session:
                 session_id = None
 
             new_session_turn = session_id is None
-            turn_text = render_text(cleaned_template, variables)
+            turn_text = rendered_turns.get(cleaned_template)
+            if turn_text is None:
+                turn_text = render_text(cleaned_template, variables)
+                rendered_turns[cleaned_template] = turn_text
 
             if fallback_only_mode or provider_fast_fallback:
                 fallback_used = True
@@ -107,73 +444,23 @@ class ScenarioRunner:
                     observed_reads=read_paths,
                 )
                 if fallback_reads:
-                    for fallback_path in fallback_reads:
-                        if fallback_path not in seen_reads:
-                            seen_reads.add(fallback_path)
-                            read_paths.append(fallback_path)
-                    write_json(
-                        artifact_dir / f"turn-{turn_index + 1:02d}-hydration-fallback.json",
+                    read_paths.update(dict.fromkeys(fallback_reads))
+                    artifacts.write(
+                        f"turn-{turn_index + 1:02d}-hydration-fallback.json",
+                        "hydration-fallback",
                         {
                             "fallback_reads": fallback_reads,
                         },
                     )
 
-                fallback_record = self._execute_turn_fallback(
-                    scenario=scenario,
-                    epoch=epoch,
-                    turn_index=turn_index,
-                    total_turns=len(scenario.turns),
-                    memory_root=memory_root,
-                    scope=scope,
-                    project=project,
-                    turn_text=turn_text,
-                    new_session_turn=new_session_turn,
-                )
-                fallback_session = fallback_record.get("session_id")
-                if isinstance(fallback_session, str) and fallback_session not in session_ids:
-                    session_ids.append(fallback_session)
-                command_trace.extend(fallback_record["command_trace"])
-                audit = _audit_memory_commands(
-                    command_trace,
-                    memory_root=memory_root,
-                    scope=scope,
-                )
-                write_json(
-                    artifact_dir / f"turn-{turn_index + 1:02d}-events.json",
-                    {
-                        "session_id": session_id,
-                        "prompt": (
-                            "fallback-only-mode"
-                            if fallback_only_mode
-                            else "provider-fast-fallback"
-                        ),
-                        "stdout": "",
-                        "stderr": "",
-                        "exit_code": 0,
-                        "events": [],
-                        "texts": [],
-                        "tool_commands": [],
-                        "audit": audit,
-                        "fallback_execution": fallback_record,
-                        "compliance_repair": None,
-                        "provider_blocked": provider_fast_fallback,
-                        "provider_block_reasons": (
-                            sorted(provider_block_reasons) if provider_fast_fallback else []
-                        ),
-                    },
-                )
-                self._progress(
-                    "scenario_turn_finish",
-                    {
-                        "scenario_id": scenario.id,
-                        "partition": partition,
-                        "epoch": epoch,
-                        "turn_index": turn_index + 1,
-                        "turn_total": len(scenario.turns),
-                        "memoryctl_commands": len(fallback_record["command_trace"]),
-                        "root_hits": audit["root_hits"],
-                        "scope_hits": audit["scope_hits"],
-                    },
+                finish_fallback_turn(
+                    turn_index,
+                    turn_text,
+                    new_session_turn,
+                    prompt_label=(
+                        "fallback-only-mode" if fallback_only_mode else "provider-fast-fallback"
+                    ),
+                    blocked=provider_fast_fallback,
                 )
                 continue
 
@@ -187,10 +474,11 @@ class ScenarioRunner:
                     scope=scope,
                 )
                 for attempt_index, hydration in enumerate(hydration_runs, start=1):
-                    if hydration.session_id and hydration.session_id not in session_ids:
-                        session_ids.append(hydration.session_id)
-                    assistant_messages.extend(hydration.texts)
+                    if hydration.session_id:
+                        session_ids[hydration.session_id] = None
+                    assistant_text_batches.append(hydration.texts)
                     command_trace.extend(hydration.tool_commands)
+                    memoryctl_total += hydration.memoryctl_count
 
                     hydration_blocks = _detect_provider_blocks(hydration)
                     if hydration_blocks:
@@ -198,15 +486,11 @@ class ScenarioRunner:
                         provider_block_reasons.update(hydration_blocks)
                         provider_fast_fallback = True
 
-                    for path in _extract_read_paths(hydration.tool_calls):
-                        normalized = _normalize_path(path)
-                        if normalized and normalized not in seen_reads:
-                            seen_reads.add(normalized)
-                            read_paths.append(normalized)
+                    read_paths.update(dict.fromkeys(_extract_read_paths(hydration.tool_calls)))
 
-                    write_json(
-                        artifact_dir
-                        / f"turn-{turn_index + 1:02d}-hydration-{attempt_index:02d}-events.json",
+                    artifacts.write(
+                        f"turn-{turn_index + 1:02d}-hydration-{attempt_index:02d}-events.json",
+                        "hydration",
                         {
                             "session_id": hydration.session_id,
                             "stdout": hydration.stdout,
@@ -223,17 +507,17 @@ class ScenarioRunner:
                     observed_reads=read_paths,
                 )
                 if fallback_reads:
-                    for fallback_path in fallback_reads:
-                        if fallback_path not in seen_reads:
-                            seen_reads.add(fallback_path)
-                            read_paths.append(fallback_path)
-                    write_json(
-                        artifact_dir / f"turn-{turn_index + 1:02d}-hydration-fallback.json",
+                    read_paths.update(dict.fromkeys(fallback_reads))
+                    artifacts.write(
+                        f"turn-{turn_index + 1:02d}-hydration-fallback.json",
+                        "hydration-fallback",
                         {
                             "fallback_reads": fallback_reads,
                         },
                     )
 
+            if contract_header is None and (turn_index == 0 or new_session_turn):
+                contract_header = self._contract_template.render(variables)
             prompt = self._build_prompt(
                 scenario=scenario,
                 turn_text=turn_text,
@@ -241,60 +525,17 @@ class ScenarioRunner:
                 total_turns=len(scenario.turns),
                 variables=variables,
                 new_session_turn=new_session_turn,
+                contract_header=contract_header,
             )
 
             if provider_fast_fallback:
                 fallback_used = True
-                fallback_record = self._execute_turn_fallback(
-                    scenario=scenario,
-                    epoch=epoch,
-                    turn_index=turn_index,
-                    total_turns=len(scenario.turns),
-                    memory_root=memory_root,
-                    scope=scope,
-                    project=project,
-                    turn_text=turn_text,
-                    new_session_turn=new_session_turn,
-                )
-                fallback_session = fallback_record.get("session_id")
-                if isinstance(fallback_session, str) and fallback_session not in session_ids:
-                    session_ids.append(fallback_session)
-                command_trace.extend(fallback_record["command_trace"])
-                audit = _audit_memory_commands(
-                    command_trace,
-                    memory_root=memory_root,
-                    scope=scope,
-                )
-                write_json(
-                    artifact_dir / f"turn-{turn_index + 1:02d}-events.json",
-                    {
-                        "session_id": session_id,
-                        "prompt": "provider-fast-fallback",
-                        "stdout": "",
-                        "stderr": "",
-                        "exit_code": 0,
-                        "events": [],
-                        "texts": [],
-                        "tool_commands": [],
-                        "audit": audit,
-                        "fallback_execution": fallback_record,
-                        "compliance_repair": None,
-                        "provider_blocked": True,
-                        "provider_block_reasons": sorted(provider_block_reasons),
-                    },
-                )
-                self._progress(
-                    "scenario_turn_finish",
-                    {
-                        "scenario_id": scenario.id,
-                        "partition": partition,
-                        "epoch": epoch,
-                        "turn_index": turn_index + 1,
-                        "turn_total": len(scenario.turns),
-                        "memoryctl_commands": len(fallback_record["command_trace"]),
-                        "root_hits": audit["root_hits"],
-                        "scope_hits": audit["scope_hits"],
-                    },
+                finish_fallback_turn(
+                    turn_index,
+                    turn_text,
+                    new_session_turn,
+                    prompt_label="provider-fast-fallback",
+                    blocked=True,
                 )
                 continue
 
@@ -315,6 +556,7 @@ class ScenarioRunner:
                 provider_block_reasons.update(first_blocks)
                 provider_fast_fallback = True
             run_attempts = [first_events]
+            retry_artifacts: list[str] = []
             session_id = first_events.session_id or session_id
 
             for attempt in range(1, 2):
@@ -368,8 +610,11 @@ class ScenarioRunner:
                 if turn_provider_blocked:
                     break
 
-                write_json(
-                    artifact_dir / f"turn-{turn_index + 1:02d}-retry-{attempt:02d}-events.json",
+                retry_artifact = f"turn-{turn_index + 1:02d}-retry-{attempt:02d}-events.json"
+                retry_artifacts.append(retry_artifact)
+                artifacts.write(
+                    retry_artifact,
+                    "retry",
                     {
                         "session_id": session_id,
                         "prompt": retry_prompt,
@@ -382,8 +627,14 @@ class ScenarioRunner:
                     },
                 )
 
-            merged_events = _merge_run_events(run_attempts)
-            merged_blocks = _detect_provider_blocks(merged_events)
+            if len(run_attempts) == 1:
+                # No retry ran: the first attempt is the merged result and its
+                # provider blocks were already detected above.
+                merged_events = first_events
+                merged_blocks = first_blocks
+            else:
+                merged_events = _merge_run_events(run_attempts)
+                merged_blocks = _detect_provider_blocks(merged_events)
             if merged_blocks:
                 provider_blocked = True
                 provider_block_reasons.update(merged_blocks)
@@ -393,9 +644,7 @@ class ScenarioRunner:
                 memory_root=memory_root,
                 scope=scope,
             )
-            memoryctl_count = sum(
-                1 for command in merged_events.tool_commands if "memoryctl.py" in command
-            )
+            memoryctl_count = merged_events.memoryctl_count
 
             fallback_record: dict[str, Any] | None = None
             if memoryctl_count == 0:
@@ -410,18 +659,16 @@ class ScenarioRunner:
                     project=project,
                     turn_text=turn_text,
                     new_session_turn=new_session_turn,
+                    memoryctl=memoryctl,
                 )
                 command_trace.extend(fallback_record["command_trace"])
+                memoryctl_total += _count_memoryctl_commands(fallback_record["command_trace"])
                 if new_session_turn:
                     fallback_session = fallback_record.get("session_id")
-                    if isinstance(fallback_session, str) and fallback_session not in session_ids:
-                        session_ids.append(fallback_session)
+                    if isinstance(fallback_session, str):
+                        session_ids[fallback_session] = None
                 memoryctl_count += len(fallback_record["command_trace"])
-                audit = _audit_memory_commands(
-                    command_trace,
-                    memory_root=memory_root,
-                    scope=scope,
-                )
+                audit = trace_audit.update(command_trace)
                 if merged_events.exit_code == 124:
                     fallback_only_mode = True
 
@@ -434,37 +681,40 @@ class ScenarioRunner:
                     scenario_id=scenario.id,
                 )
                 command_trace.extend(repair_record["command_trace"])
-                audit = _audit_memory_commands(
-                    command_trace,
-                    memory_root=memory_root,
-                    scope=scope,
-                )
+                memoryctl_total += _count_memoryctl_commands(repair_record["command_trace"])
+                audit = trace_audit.update(command_trace)
 
             session_id = merged_events.session_id or session_id
-            if session_id and session_id not in session_ids:
-                session_ids.append(session_id)
+            if session_id:
+                session_ids[session_id] = None
 
             turns.append(merged_events)
-            assistant_messages.extend(merged_events.texts)
+            assistant_text_batches.append(merged_events.texts)
             command_trace.extend(merged_events.tool_commands)
-
-            for path in _extract_read_paths(merged_events.tool_calls):
-                normalized = _normalize_path(path)
-                if normalized and normalized not in seen_reads:
-                    seen_reads.add(normalized)
-                    read_paths.append(normalized)
-
-            write_json(
-                artifact_dir / f"turn-{turn_index + 1:02d}-events.json",
+            memoryctl_total += merged_events.memoryctl_count
+
+            read_paths.update(dict.fromkeys(_extract_read_paths(merged_events.tool_calls)))
+
+            # When every retry already has its own artifact, record only the
+            # first attempt inline and point at the retry files.
+            if retry_artifacts and len(retry_artifacts) == len(run_attempts) - 1:
+                recorded_events = first_events
+            else:
+                recorded_events = merged_events
+                retry_artifacts = []
+            artifacts.write(
+                f"turn-{turn_index + 1:02d}-events.json",
+                "events",
                 {
                     "session_id": session_id,
                     "prompt": prompt,
-                    "stdout": merged_events.stdout,
-                    "stderr": merged_events.stderr,
-                    "exit_code": merged_events.exit_code,
-                    "events": merged_events.events,
-                    "texts": merged_events.texts,
-                    "tool_commands": merged_events.tool_commands,
+                    "stdout": recorded_events.stdout,
+                    "stderr": recorded_events.stderr,
+                    "exit_code": recorded_events.exit_code,
+                    "events": recorded_events.events,
+                    "texts": recorded_events.texts,
+                    "tool_commands": recorded_events.tool_commands,
+                    "retry_artifacts": retry_artifacts,
                     "audit": audit,
                     "fallback_execution": fallback_record,
                     "compliance_repair": repair_record,
@@ -473,41 +723,51 @@ class ScenarioRunner:
                 },
             )
 
-            self._progress(
-                "scenario_turn_finish",
+            if progress_hook is not None:
+                progress_hook(
+                    "scenario_turn_finish",
+                    {
+                        "scenario_id": scenario.id,
+                        "partition": partition,
+                        "epoch": epoch,
+                        "turn_index": turn_index + 1,
+                        "turn_total": len(scenario.turns),
+                        "memoryctl_commands": memoryctl_count,
+                        "root_hits": audit["root_hits"],
+                        "scope_hits": audit["scope_hits"],
+                    },
+                )
+
+        exported_session_path: Path | None = None
+        # A session that ran no memoryctl command and produced no text has
+        # nothing worth exporting; skip the round trip and the large write.
+        session_active = memoryctl_total > 0 or any(assistant_text_batches)
+        if session_id and self.export_sessions and session_active:
+            # Nothing in the scenario result reads the export, so it runs in
+            # the background; callers wait for it with `join_exports`.
+            exported_session_path = artifact_dir / "session-export.json"
+            future = self._export_pool.submit(
+                self._export_session,
+                session_id,
+                exported_session_path,
+            )
+            with self._export_lock:
+                self._export_futures.append(future)
+
+        if progress_hook is not None:
+            progress_hook(
+                "scenario_execute_finish",
                 {
                     "scenario_id": scenario.id,
                     "partition": partition,
                     "epoch": epoch,
-                    "turn_index": turn_index + 1,
-                    "turn_total": len(scenario.turns),
-                    "memoryctl_commands": memoryctl_count,
-                    "root_hits": audit["root_hits"],
-                    "scope_hits": audit["scope_hits"],
+                    "session_ids": list(session_ids),
+                    "memoryctl_commands": memoryctl_total,
+                    "skill_reads": len(read_paths),
+                    "provider_blocked": provider_blocked,
                 },
             )
 
-        exported_session_path: Path | None = None
-        if session_id and self.export_sessions:
-            exported_payload = self.client.export_session(session_id)
-            exported_session_path = artifact_dir / "session-export.json"
-            write_json(exported_session_path, exported_payload)
-
-        self._progress(
-            "scenario_execute_finish",
-            {
-                "scenario_id": scenario.id,
-                "partition": partition,
-                "epoch": epoch,
-                "session_ids": session_ids,
-                "memoryctl_commands": sum(
-                    1 for command in command_trace if "memoryctl.py" in command
-                ),
-                "skill_reads": len(read_paths),
-                "provider_blocked": provider_blocked,
-            },
-        )
-
         return ScenarioExecution(
             scenario=scenario,
             partition=partition,
@@ -516,10 +776,10 @@ class ScenarioRunner:
             artifact_dir=artifact_dir,
             session_id=session_id,
             turns=turns,
-            assistant_messages=assistant_messages,
+            assistant_messages=list(itertools.chain.from_iterable(assistant_text_batches)),
             command_trace=command_trace,
-            read_paths=read_paths,
-            session_ids=session_ids,
+            read_paths=list(read_paths),
+            session_ids=list(session_ids),
             exported_session_path=exported_session_path,
             fallback_used=fallback_used,
             fallback_only_mode=fallback_only_mode,
@@ -527,6 +787,16 @@ class ScenarioRunner:
             provider_block_reasons=sorted(provider_block_reasons),
         )
 
+    def join_exports(self) -> None:
+        """Wait for pending session exports and re-raise the first failure."""
+        with self._export_lock:
+            futures, self._export_futures = self._export_futures, []
+        for future in futures:
+            future.result()
+
+    def _export_session(self, session_id: str, path: Path) -> None:
+        write_json(path, self.client.export_session(session_id))
+
     def _progress(self, event: str, payload: dict[str, Any]) -> None:
         if self.progress_hook is not None:
             self.progress_hook(event, payload)
@@ -572,7 +842,16 @@ class ScenarioRunner:
             if attempt >= attempts:
                 return run
 
-            backoff_seconds = self.provider_retry_backoff_seconds * attempt
+            # Exponential backoff with full jitter. Scenarios run one at a time,
+            # but separate evolution processes (e.g. a sweep) can share one
+            # provider account and would otherwise retry in lock-step.
+            backoff_seconds = random.uniform(
+                0.0,
+                min(
+                    self.provider_retry_backoff_max_seconds,
+                    self.provider_retry_backoff_seconds * (2 ** (attempt - 1)),
+                ),
+            )
             self._progress(
                 "runner_provider_retry",
                 {
@@ -581,7 +860,7 @@ class ScenarioRunner:
                     "turn_index": turn_index + 1,
                     "phase": phase,
                     "attempt": attempt,
-                    "wait_seconds": backoff_seconds,
+                    "wait_seconds": round(backoff_seconds, 3),
                     "reasons": provider_reasons,
                 },
             )
@@ -600,19 +879,16 @@ class ScenarioRunner:
         total_turns: int,
         variables: dict[str, str],
         new_session_turn: bool,
+        contract_header: str | None,
     ) -> str:
         if turn_index == 0 or new_session_turn:
-            header = render_text(self.runner_contract, variables)
-            skill_read_list = "\n".join(
-                f"- {path}" for path in self.skill_paths
-            )
             return (
-                f"{header}\n\n"
+                f"{contract_header}\n\n"
                 f"Scenario ID: {scenario.id}\n"
                 f"Complexity mode: {scenario.complexity_mode}\n"
                 f"Turn: {turn_index + 1}/{total_turns}\n\n"
                 "Skill hydration requirement: before planning or execution, read these files now:"
-                f"\n{skill_read_list}\n\n"
+                f"\n{self._skill_manifest}\n\n"
                 "Every memoryctl command in this turn must include both --root and --scope.\n"
                 f"Required root: {variables['memory_root']}\n"
                 f"Required scope: {variables['scope']}\n\n"
@@ -634,23 +910,58 @@ class ScenarioRunner:
             f"User request:\n{turn_text}\n"
         )
 
-    def _local_hydration_fallback(self, *, observed_reads: list[str]) -> list[str]:
-        missing = [
+    def _missing_skill_paths(
+        self,
+        observed_reads: Iterable[str],
+        *,
+        among: list[str] | None = None,
+    ) -> list[str]:
+        # Observed reads are already normalized by _extract_read_paths;
+        # repeated reads of one file are only checked once. `among` limits
+        # the check to paths already known to be missing.
+        observed = frozenset(observed_reads)
+        candidates = self._skill_path_suffixes
+        if among is not None:
+            wanted = set(among)
+            candidates = [(path, suffix) for path, suffix in candidates if path in wanted]
+        return [
             path
-            for path in self.skill_paths
-            if not any(_path_matches(read_path, path) for read_path in observed_reads)
+            for path, suffix in candidates
+            if not any(read_path.endswith(suffix) for read_path in observed)
         ]
+
+    def _local_hydration_fallback(self, *, observed_reads: Iterable[str]) -> list[str]:
+        missing = self._missing_skill_paths(observed_reads)
         restored: list[str] = []
         for path in missing:
-            candidate = self.workspace_root / path
-            if candidate.exists() and candidate.is_file():
-                try:
-                    candidate.read_text(encoding="utf-8")
-                except UnicodeDecodeError:
-                    candidate.read_text(encoding="utf-8", errors="replace")
-                restored.append(_normalize_path(str(candidate)))
+            restored_path = self._restore_skill_file(path)
+            if restored_path is not None:
+                restored.append(restored_path)
         return restored
 
+    def _restore_skill_file(self, path: str) -> str | None:
+        candidate = self.workspace_root / path
+        try:
+            file_stat = candidate.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+
+        # Skill files only change between epochs, so re-read one only when its
+        # mtime moves; otherwise reuse the earlier result.
+        cached = self._restored_skill_files.get(path)
+        if cached is not None and cached[0] == file_stat.st_mtime_ns:
+            return cached[1]
+
+        try:
+            candidate.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            candidate.read_text(encoding="utf-8", errors="replace")
+        restored_path = _normalize_path(str(candidate))
+        self._restored_skill_files[path] = (file_stat.st_mtime_ns, restored_path)
+        return restored_path
+
     def _execute_compliance_repair(
         self,
         *,
@@ -659,64 +970,29 @@ class ScenarioRunner:
         project: str,
         scenario_id: str,
     ) -> dict[str, Any]:
-        command_specs = [
-            [
-                "python",
-                ".opencode/skills/diasync-memory/scripts/memoryctl.py",
-                "stats",
-                "--root",
-                str(memory_root),
-                "--scope",
-                scope,
-            ],
-            [
-                "python",
-                ".opencode/skills/diasync-memory/scripts/memoryctl.py",
-                "capture",
-                "--root",
-                str(memory_root),
-                "--scope",
-                scope,
-                "--project",
-                project,
-                "--instance-id",
-                "ins-evo-repair",
-                "--summary",
-                f"Compliance repair anchor for scenario {scenario_id}",
-                "--proposed-type",
-                "fact",
-                "--salience",
-                "low",
-                "--confidence",
-                "0.5",
-            ],
-            [
-                "python",
-                ".opencode/skills/diasync-memory/scripts/memoryctl.py",
-                "sync",
-                "stop",
-                "--root",
-                str(memory_root),
-                "--instance-id",
-                "ins-evo-repair",
-                "--scope",
-                scope,
-            ],
-            [
-                "python",
-                ".opencode/skills/diasync-memory/scripts/memoryctl.py",
-                "validate",
-                "--root",
-                str(memory_root),
-                "--strict",
-            ],
-        ]
+        command_specs = _compliance_repair_specs(
+            str(memory_root),
+            scope,
+            project,
+            scenario_id,
+        )
+
+        def run_repair_command(spec: tuple[tuple[str, ...], str]) -> CommandResult:
+            return run_command(
+                args=memoryctl_process_args(list(spec[0])),
+                cwd=self.workspace_root,
+                timeout_seconds=120,
+            )
+
+        # stats -> capture -> sync stop -> validate run strictly in order, so
+        # the stats result reflects the store before the repair writes.
+        results = self._run_memoryctl_batch(command_specs, timeout_seconds=120)
+        if results is None:
+            results = [run_repair_command(spec) for spec in command_specs]
 
         records: list[dict[str, Any]] = []
         command_trace: list[str] = []
-        for args in command_specs:
-            result = run_command(args=args, cwd=self.workspace_root, timeout_seconds=120)
-            command_text = _format_command(args)
+        for (_, command_text), result in zip(command_specs, results):
             records.append(
                 {
                     "command": command_text,
@@ -732,6 +1008,103 @@ class ScenarioRunner:
             "command_trace": command_trace,
         }
 
+    def _run_memoryctl_batch(
+        self,
+        command_specs: tuple[tuple[tuple[str, ...], str], ...],
+        *,
+        timeout_seconds: int,
+    ) -> list[CommandResult] | None:
+        # One `memoryctl batch --jsonl` process for an ordered chain. Results
+        # arrive one line per command, so each command gets its own
+        # timeout_seconds and the process is killed once one is late. Returns
+        # None when nothing can be mapped back (e.g. a build without `batch`),
+        # so the caller can still run the commands one by one.
+        first_args = command_specs[0][0]
+        try:
+            process = subprocess.Popen(
+                memoryctl_process_args(
+                    [first_args[0], first_args[1], "batch", "--spec", "-", "--jsonl"]
+                ),
+                cwd=self.workspace_root,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except OSError:
+            return None
+        assert process.stdin is not None and process.stdout is not None and process.stderr is not None
+        lines: queue.Queue[bytes | None] = queue.Queue()
+        stderr_chunks: list[bytes] = []
+        threading.Thread(
+            target=_queue_lines,
+            args=(process.stdout, lines),
+            name="memoryctl-batch",
+            daemon=True,
+        ).start()
+        stderr_reader = threading.Thread(
+            target=lambda stream=process.stderr: stderr_chunks.append(stream.read()),
+            name="memoryctl-batch-stderr",
+            daemon=True,
+        )
+        stderr_reader.start()
+        try:
+            process.stdin.write(json.dumps([list(args[2:]) for args, _ in command_specs]).encode("utf-8"))
+            process.stdin.close()
+        except OSError:
+            pass  # The process already exited; whatever it printed is still read below.
+
+        entries: list[dict[str, Any]] = []
+        timed_out = False
+        for _ in command_specs:
+            try:
+                line = lines.get(timeout=timeout_seconds)
+            except queue.Empty:
+                timed_out = True
+                process.kill()
+                break
+            if line is None:
+                break
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            if not isinstance(entry, dict):
+                break
+            entries.append(entry)
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        stderr_reader.join(timeout=5)
+        stderr_text = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+        if timed_out:
+            stderr_text = (stderr_text + "\nCommand timed out.").strip("\n")
+        if not entries and not timed_out:
+            return None
+
+        results = [
+            CommandResult(
+                args=list(args),
+                exit_code=int(entry.get("exit_code", 1)),
+                stdout=str(entry.get("stdout", "")),
+                stderr=str(entry.get("stderr", "")),
+            )
+            for (args, _), entry in zip(command_specs, entries)
+        ]
+        # The rest of the chain may have started; report it instead of repeating it.
+        unfinished_exit_code = 124 if timed_out else 1
+        for args, _ in command_specs[len(entries) :]:
+            results.append(
+                CommandResult(
+                    args=list(args),
+                    exit_code=unfinished_exit_code,
+                    stdout="",
+                    stderr=stderr_text,
+                )
+            )
+        return results
+
     def _execute_turn_fallback(
         self,
         *,
@@ -744,6 +1117,7 @@ class ScenarioRunner:
         project: str,
         turn_text: str,
         new_session_turn: bool,
+        memoryctl: _MemoryctlServer,
     ) -> dict[str, Any]:
         instance_id = f"ins-fallback-e{epoch}-t{turn_index + 1}"
         session_id = f"fallback-session-e{epoch}-t{turn_index + 1}"
@@ -873,7 +1247,7 @@ class ScenarioRunner:
         records: list[dict[str, Any]] = []
         command_trace: list[str] = []
         for args in command_specs:
-            result = run_command(args=args, cwd=self.workspace_root, timeout_seconds=60)
+            result = memoryctl.run(args, timeout_seconds=60)
             command_text = _format_command(args)
             records.append(
                 {
@@ -904,22 +1278,24 @@ class ScenarioRunner:
     ) -> tuple[str | None, list[RunEvents]]:
         runs: list[RunEvents] = []
         active_session = session_id
-        observed_reads: list[str] = []
+        # Reads only grow, so each attempt only checks its own new reads
+        # against the paths still missing after the previous attempt.
+        missing = self._missing_skill_paths(())
+        # An attempt that read nothing new re-sends the same prompt.
+        prompt_paths: list[str] | None = None
+        hydration_prompt = ""
 
         for attempt in range(1, 4):
-            missing = [
-                path
-                for path in self.skill_paths
-                if not any(_path_matches(read_path, path) for read_path in observed_reads)
-            ]
-            hydration_prompt = self._build_hydration_prompt(
-                scenario=scenario,
-                epoch=epoch,
-                turn_index=turn_index,
-                memory_root=memory_root,
-                scope=scope,
-                missing_paths=missing,
-            )
+            if missing != prompt_paths:
+                prompt_paths = missing
+                hydration_prompt = self._build_hydration_prompt(
+                    scenario=scenario,
+                    epoch=epoch,
+                    turn_index=turn_index,
+                    memory_root=memory_root,
+                    scope=scope,
+                    missing_paths=missing,
+                )
             run = self._run_with_provider_retry(
                 prompt=hydration_prompt,
                 session_id=active_session,
@@ -940,10 +1316,7 @@ class ScenarioRunner:
             if _detect_provider_blocks(run):
                 break
 
-            for read_path in _extract_read_paths(run.tool_calls):
-                normalized = _normalize_path(read_path)
-                if normalized:
-                    observed_reads.append(normalized)
+            new_reads = _extract_read_paths(run.tool_calls)
 
             audit = _audit_memory_commands(
                 run.tool_commands,
@@ -952,12 +1325,9 @@ class ScenarioRunner:
             )
             if run.exit_code == 124 and not run.tool_commands:
                 break
-            missing_after = [
-                path
-                for path in self.skill_paths
-                if not any(_path_matches(read_path, path) for read_path in observed_reads)
-            ]
-            if not missing_after and audit["root_hits"] > 0 and audit["scope_hits"] > 0:
+            if new_reads:
+                missing = self._missing_skill_paths(new_reads, among=missing)
+            if not missing and audit["root_hits"] > 0 and audit["scope_hits"] > 0:
                 break
 
             if attempt >= 3:
@@ -975,8 +1345,10 @@ class ScenarioRunner:
         scope: str,
         missing_paths: list[str],
     ) -> str:
-        read_targets = missing_paths if missing_paths else self.skill_paths
-        read_list = "\n".join(f"- {path}" for path in read_targets)
+        if missing_paths:
+            read_list = "\n".join(f"- {path}" for path in missing_paths)
+        else:
+            read_list = self._skill_manifest
         return (
             "Skill hydration bootstrap before scenario execution.\n"
             f"Scenario: {scenario.id}\n"
@@ -991,49 +1363,43 @@ class ScenarioRunner:
 
 
 def _parse_turn_directive(template: str) -> tuple[bool, str]:
-    stripped = template.lstrip()
-    markers = ("[[NEW_SESSION]]", "[NEW_SESSION]", "@new_session")
-    for marker in markers:
-        if stripped.startswith(marker):
-            remainder = stripped[len(marker) :].lstrip(" :\n\t")
-            return True, remainder if remainder else template
-    return False, template
+    match = NEW_SESSION_DIRECTIVE_RE.match(template)
+    if match is None:
+        return False, template
+    remainder = template[match.end() :]
+    return True, remainder if remainder else template
 
 
-def _detect_provider_blocks(run: RunEvents) -> list[str]:
+def _error_signals(run: RunEvents) -> tuple[set[str], list[str]]:
+    # Status reasons and texts both provider detectors scan.
     reasons: set[str] = set()
     texts: list[str] = [run.stdout, run.stderr]
+    for data in run.error_data:
+        status_value = _parse_status_code(data.get("statusCode"))
+        if status_value is not None:
+            reasons.add(f"status_{status_value}")
 
-    for event in run.events:
-        if not isinstance(event, dict):
-            continue
-        if event.get("type") != "error":
-            continue
-
-        error_payload = event.get("error")
-        if not isinstance(error_payload, dict):
-            continue
+        for key in ("message", "responseBody"):
+            value = data.get(key)
+            if isinstance(value, str) and value:
+                texts.append(value)
+    return reasons, texts
 
-        data = error_payload.get("data")
-        if isinstance(data, dict):
-            status_value = _parse_status_code(data.get("statusCode"))
-            if status_value is not None:
-                reasons.add(f"status_{status_value}")
 
-            for key in ("message", "responseBody"):
-                value = data.get(key)
-                if isinstance(value, str) and value:
-                    texts.append(value)
+def _detect_provider_blocks(run: RunEvents) -> list[str]:
+    reasons, texts = _error_signals(run)
 
     for text in texts:
-        lowered = text.lower()
-        if "insufficient_quota" in lowered or "total_cost_limit_exceeded" in lowered:
+        found = set(PROVIDER_BLOCK_MARKERS_RE.findall(text.lower()))
+        if not found:
+            continue
+        if "insufficient_quota" in found or "total_cost_limit_exceeded" in found:
             reasons.add("insufficient_quota")
-        if "payment required" in lowered:
+        if "payment required" in found:
             reasons.add("payment_required")
-        if "invalid_api_key" in lowered:
+        if "invalid_api_key" in found:
             reasons.add("invalid_api_key")
-        if "authentication" in lowered and "failed" in lowered:
+        if "authentication" in found and "failed" in found:
             reasons.add("authentication_failed")
 
     blocking = {
@@ -1049,47 +1415,14 @@ def _detect_provider_blocks(run: RunEvents) -> list[str]:
 
 
 def _detect_transient_provider_errors(run: RunEvents) -> list[str]:
-    reasons: set[str] = set()
-    texts: list[str] = [run.stdout, run.stderr]
-
-    for event in run.events:
-        if not isinstance(event, dict):
-            continue
-        if event.get("type") != "error":
-            continue
-
-        error_payload = event.get("error")
-        if not isinstance(error_payload, dict):
-            continue
-
-        data = error_payload.get("data")
-        if not isinstance(data, dict):
-            continue
-
-        status_value = _parse_status_code(data.get("statusCode"))
-        if status_value is not None:
-            reasons.add(f"status_{status_value}")
-
-        for key in ("message", "responseBody"):
-            value = data.get(key)
-            if isinstance(value, str) and value:
-                texts.append(value)
+    reasons, texts = _error_signals(run)
 
     if run.exit_code == 124:
         reasons.add("timeout")
 
     for text in texts:
-        lowered = text.lower()
-        if "too many requests" in lowered or "rate limit" in lowered:
-            reasons.add("rate_limit")
-        if "temporarily unavailable" in lowered or "service unavailable" in lowered:
-            reasons.add("service_unavailable")
-        if "timed out" in lowered or "timeout" in lowered:
-            reasons.add("timeout")
-        if "connection reset" in lowered or "econnreset" in lowered:
-            reasons.add("connection_reset")
-        if "network error" in lowered or "upstream" in lowered:
-            reasons.add("network_error")
+        for marker in TRANSIENT_ERROR_MARKERS_RE.findall(text.lower()):
+            reasons.add(TRANSIENT_ERROR_REASONS[marker])
 
     transient = {
         "status_408",
@@ -1125,15 +1458,12 @@ def _parse_status_code(value: object) -> int | None:
 def _extract_read_paths(tool_calls: list[dict]) -> list[str]:
     paths: list[str] = []
     for call in tool_calls:
-        tool_name = call.get("tool")
-        if tool_name != "read":
+        if call.get("tool") != "read":
             continue
 
-        state = call.get("state", {})
-        input_payload = state.get("input", {})
-        file_path = input_payload.get("filePath")
+        file_path = call.get("state", {}).get("input", {}).get("filePath")
         if isinstance(file_path, str) and file_path:
-            paths.append(file_path)
+            paths.append(_normalize_path(file_path))
     return paths
 
 
@@ -1141,40 +1471,127 @@ def _normalize_path(value: str) -> str:
     return value.replace("\\", "/")
 
 
+def _count_memoryctl_commands(commands: list[str]) -> int:
+    return sum("memoryctl.py" in command for command in commands)
+
+
+class _CommandAudit:
+    """Running memoryctl audit over an append-only command list.
+
+    ``update`` only scans commands added since the previous call, so auditing
+    a scenario's growing ``command_trace`` stays linear over the scenario.
+    """
+
+    def __init__(self, *, memory_root: Path, scope: str) -> None:
+        self._normalized_root = _normalize_command_text(str(memory_root))
+        self._normalized_scope = _normalize_command_text(scope)
+        self._audited = 0
+        self.has_memoryctl = False
+        self.root_hits = 0
+        self.scope_hits = 0
+
+    def update(self, commands: list[str]) -> dict[str, int | bool]:
+        pending = commands[self._audited :]
+        self._audited = len(commands)
+        if "memoryctl.py" in "\x1f".join(pending):
+            for command in pending:
+                if "memoryctl.py" not in command:
+                    continue
+                self.has_memoryctl = True
+                normalized = _normalize_command_text(command)
+                if "--root" in normalized and self._normalized_root in normalized:
+                    self.root_hits += 1
+                if "--scope" in normalized and self._normalized_scope in normalized:
+                    self.scope_hits += 1
+
+        return {
+            "has_memoryctl": self.has_memoryctl,
+            "root_hits": self.root_hits,
+            "scope_hits": self.scope_hits,
+        }
+
+
 def _audit_memory_commands(
     commands: list[str],
     *,
     memory_root: Path,
     scope: str,
 ) -> dict[str, int | bool]:
-    memoryctl_commands = [command for command in commands if "memoryctl.py" in command]
-    normalized_root = _normalize_command_text(str(memory_root))
-    normalized_scope = _normalize_command_text(scope)
-
-    root_hits = 0
-    scope_hits = 0
-    for command in memoryctl_commands:
-        normalized = _normalize_command_text(command)
-        if "--root" in normalized and normalized_root in normalized:
-            root_hits += 1
-        if "--scope" in normalized and normalized_scope in normalized:
-            scope_hits += 1
-
-    return {
-        "has_memoryctl": bool(memoryctl_commands),
-        "root_hits": root_hits,
-        "scope_hits": scope_hits,
-    }
+    return _CommandAudit(memory_root=memory_root, scope=scope).update(commands)
+
+
+def _queue_lines(stream: BinaryIO, lines: queue.Queue[bytes | None]) -> None:
+    for line in stream:
+        lines.put(line)
+    lines.put(None)
 
 
 def _normalize_command_text(value: str) -> str:
     return value.replace("\\", "/").replace('"', "")
 
 
-def _path_matches(observed: str, required: str) -> bool:
-    observed_norm = observed.replace("\\", "/")
-    required_norm = required.replace("\\", "/")
-    return observed_norm.endswith(required_norm)
+@functools.lru_cache(maxsize=64)
+def _compliance_repair_specs(
+    memory_root: str,
+    scope: str,
+    project: str,
+    scenario_id: str,
+) -> tuple[tuple[tuple[str, ...], str], ...]:
+    # Repairs repeat within a scenario with identical arguments; build the
+    # argument lists and their display text once per scenario.
+    command_specs = [
+        [
+            "python",
+            ".opencode/skills/diasync-memory/scripts/memoryctl.py",
+            "stats",
+            "--root",
+            memory_root,
+            "--scope",
+            scope,
+        ],
+        [
+            "python",
+            ".opencode/skills/diasync-memory/scripts/memoryctl.py",
+            "capture",
+            "--root",
+            memory_root,
+            "--scope",
+            scope,
+            "--project",
+            project,
+            "--instance-id",
+            "ins-evo-repair",
+            "--summary",
+            f"Compliance repair anchor for scenario {scenario_id}",
+            "--proposed-type",
+            "fact",
+            "--salience",
+            "low",
+            "--confidence",
+            "0.5",
+        ],
+        [
+            "python",
+            ".opencode/skills/diasync-memory/scripts/memoryctl.py",
+            "sync",
+            "stop",
+            "--root",
+            memory_root,
+            "--instance-id",
+            "ins-evo-repair",
+            "--scope",
+            scope,
+        ],
+        [
+            "python",
+            ".opencode/skills/diasync-memory/scripts/memoryctl.py",
+            "validate",
+            "--root",
+            memory_root,
+            "--strict",
+        ],
+    ]
+    return tuple((tuple(args), _format_command(args)) for args in command_specs)
 
 
 def _format_command(args: list[str]) -> str:
@@ -1188,7 +1605,9 @@ def _format_command(args: list[str]) -> str:
 
 
 def _clip_summary(text: str, *, max_len: int) -> str:
-    normalized = " ".join(text.split())
+    # Joined words take at least two characters each, so words past the
+    # first max_len never reach the clipped result; stop splitting there.
+    normalized = " ".join(text.split(maxsplit=max_len)[:max_len])
     if len(normalized) <= max_len:
         return normalized
     if max_len <= 3:
@@ -1200,14 +1619,29 @@ def _merge_run_events(runs: list[RunEvents]) -> RunEvents:
     if len(runs) == 1:
         return runs[0]
 
-    session_id = runs[-1].session_id or runs[0].session_id
+    stdout: list[str] = []
+    stderr: list[str] = []
+    events: list[dict[str, Any]] = []
+    texts: list[str] = []
+    tool_commands: list[str] = []
+    tool_calls: list[dict[str, Any]] = []
+    for run in runs:
+        if run.stdout:
+            stdout.append(run.stdout)
+        if run.stderr:
+            stderr.append(run.stderr)
+        events.extend(run.events)
+        texts.extend(run.texts)
+        tool_commands.extend(run.tool_commands)
+        tool_calls.extend(run.tool_calls)
+
     return RunEvents(
-        session_id=session_id,
-        stdout="\n".join(run.stdout for run in runs if run.stdout),
-        stderr="\n".join(run.stderr for run in runs if run.stderr),
+        session_id=runs[-1].session_id or runs[0].session_id,
+        stdout="\n".join(stdout),
+        stderr="\n".join(stderr),
         exit_code=runs[-1].exit_code,
-        events=[event for run in runs for event in run.events],
-        texts=[text for run in runs for text in run.texts],
-        tool_commands=[command for run in runs for command in run.tool_commands],
-        tool_calls=[call for run in runs for call in run.tool_calls],
+        events=events,
+        texts=texts,
+        tool_commands=tool_commands,
+        tool_calls=tool_calls,
     )
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import json
+import functools
 import random
+import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .io_utils import decode_json
 from .models import Scenario
 
 
@@ -14,25 +17,31 @@ class SafeFormat(dict):
 
 def load_scenarios(workspace_root: Path, pattern: str) -> list[Scenario]:
     files = sorted(workspace_root.glob(pattern))
-    scenarios: list[Scenario] = []
-
-    for file_path in files:
-        payload = json.loads(file_path.read_text(encoding="utf-8"))
-        scenario = Scenario(
-            id=payload["id"],
-            title=payload["title"],
-            description=payload["description"],
-            complexity_mode=payload.get("complexity_mode", "mixed"),
-            difficulty=int(payload.get("difficulty", 1)),
-            turns=list(payload.get("turns", [])),
-            success_criteria=list(payload.get("success_criteria", [])),
-            tags=list(payload.get("tags", [])),
-            weights=dict(payload.get("weights", {})),
-            metadata=dict(payload.get("metadata", {})),
-        )
-        scenarios.append(scenario)
-
-    return scenarios
+    paths = [str(file_path.resolve()) for file_path in files]
+    mtimes = [file_path.stat().st_mtime_ns for file_path in files]
+    if len(files) <= 1:
+        return [_load_scenario_file(path, mtime) for path, mtime in zip(paths, mtimes)]
+    # Reads release the GIL, so slow filesystems overlap their latency.
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        return list(executor.map(_load_scenario_file, paths, mtimes))
+
+
+@functools.lru_cache(maxsize=256)
+def _load_scenario_file(path: str, mtime_ns: int) -> Scenario:
+    # mtime_ns is part of the cache key so edited scenario files are re-parsed.
+    payload = decode_json(Path(path).read_bytes())
+    return Scenario(
+        id=payload["id"],
+        title=payload["title"],
+        description=payload["description"],
+        complexity_mode=payload.get("complexity_mode", "mixed"),
+        difficulty=int(payload.get("difficulty", 1)),
+        turns=list(payload.get("turns", [])),
+        success_criteria=list(payload.get("success_criteria", [])),
+        tags=list(payload.get("tags", [])),
+        weights=dict(payload.get("weights", {})),
+        metadata=dict(payload.get("metadata", {})),
+    )
 
 
 def select_batch(
@@ -61,5 +70,49 @@ def select_batch(
     return rnd.sample(selected_pool, batch_size)
 
 
+class CompiledText:
+    """A ``render_text`` template parsed once and rendered many times."""
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self._segments: list[tuple[str, str | None, str]] = []
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+            if field_name is None:
+                self._segments.append((literal, None, ""))
+                continue
+            # Plain {name} fields are substituted directly; anything fancier
+            # keeps its original text and goes through format_map.
+            if field_name.isidentifier() and not format_spec and conversion is None:
+                self._segments.append((literal, field_name, ""))
+                continue
+            field_text = "{" + field_name
+            if conversion is not None:
+                field_text += "!" + conversion
+            if format_spec:
+                field_text += ":" + format_spec
+            self._segments.append((literal, None, field_text + "}"))
+
+    def render(self, variables: dict[str, str]) -> str:
+        safe_variables: SafeFormat | None = None
+        parts: list[str] = []
+        for literal, field_name, field_text in self._segments:
+            parts.append(literal)
+            if field_name is not None:
+                if field_name in variables:
+                    parts.append(str(variables[field_name]))
+                else:
+                    parts.append("{" + field_name + "}")
+            elif field_text:
+                if safe_variables is None:
+                    safe_variables = SafeFormat(**variables)
+                parts.append(field_text.format_map(safe_variables))
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_text(template: str) -> CompiledText:
+    return CompiledText(template)
+
+
 def render_text(template: str, variables: dict[str, str]) -> str:
-    return template.format_map(SafeFormat(**variables))
+    return compile_text(template).render(variables)
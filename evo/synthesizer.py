@@ -10,6 +10,9 @@ from .models import Scenario
 from .opencode_client import OpenCodeClient
 
 
+SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
+
 class ScenarioSynthesizer:
     def __init__(
         self,
@@ -25,6 +28,13 @@ class ScenarioSynthesizer:
         self.synthesis_config = synthesis_config
         self.contract = contract
         self.skill_paths = skill_paths
+        self._skill_manifest = "\n".join(f"- {path}" for path in skill_paths)
+        # The manifest is fixed per synthesizer; only the per-call fields are
+        # filled in _build_prompt, in the same order as before.
+        self._contract_template = fill_placeholders(
+            contract,
+            {"skill_manifest": self._skill_manifest},
+        )
 
     def synthesize(
         self,
@@ -126,11 +136,9 @@ class ScenarioSynthesizer:
         project: str,
         scope: str,
     ) -> str:
-        skill_manifest = "\n".join(f"- {path}" for path in self.skill_paths)
         contract = fill_placeholders(
-            self.contract,
+            self._contract_template,
             {
-                "skill_manifest": skill_manifest,
                 "partition": partition,
                 "count": str(count),
                 "project": project,
@@ -316,24 +324,29 @@ def _string_or_default(value: object, default: str) -> str:
 
 def _slugify(value: str) -> str:
     lowered = value.strip().lower()
-    lowered = re.sub(r"[^a-z0-9]+", "-", lowered)
+    lowered = SLUG_SEPARATOR_RE.sub("-", lowered)
     lowered = lowered.strip("-")
     return lowered or "scenario"
 
 
 def _clamp_int(value: object, *, minimum: int, maximum: int, fallback: int) -> int:
-    try:
-        text_value = f"{value}"
-        parsed = int(text_value)
-    except (TypeError, ValueError):
-        parsed = fallback
+    # Exact ints and strings skip the text round-trip; anything else keeps
+    # the text parse, so floats like 2.5 and bools still fall back.
+    if type(value) is int:
+        parsed = value
+    else:
+        try:
+            parsed = int(value if isinstance(value, str) else f"{value}")
+        except (TypeError, ValueError):
+            parsed = fallback
     return max(minimum, min(maximum, parsed))
 
 
 def _is_number(value: object) -> bool:
+    if type(value) in (int, float):
+        return True
     try:
-        text_value = f"{value}"
-        float(text_value)
+        float(value if isinstance(value, str) else f"{value}")
     except (TypeError, ValueError):
         return False
     return True
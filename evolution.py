@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import argparse
-import json
+import sys
 from pathlib import Path
 
-from evo.config import EvolutionConfig
-from evo.orchestrator import EvolutionOrchestrator
+
+WORKSPACE_ROOT = Path(__file__).resolve().parent
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run autonomous skill-driven evolution for DiaSync memory behavior.",
+        fromfile_prefix_chars="@",
     )
     parser.add_argument(
         "--config",
@@ -44,6 +45,18 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override wall-clock runtime limit in minutes (0 disables).",
     )
+    parser.add_argument(
+        "--evolution-timeout",
+        type=float,
+        default=None,
+        help="Hard wall-clock cap in seconds; interrupts the running epoch once exceeded.",
+    )
+    parser.add_argument(
+        "--candidate-timeout",
+        type=float,
+        default=None,
+        help="Seconds a candidate snapshot may run before it is rolled back and rejected.",
+    )
     parser.add_argument(
         "--no-progress",
         action="store_true",
@@ -55,15 +68,34 @@ def build_parser() -> argparse.ArgumentParser:
         default=15,
         help="Seconds between waiting heartbeats for long OpenCode calls.",
     )
+    parser.add_argument(
+        "--no-warm-start",
+        action="store_true",
+        help="Do not seed baseline synthesis with the previous run's train failures.",
+    )
+    parser.add_argument(
+        "--resume-from-summary",
+        type=Path,
+        default=None,
+        help="Seed baseline synthesis from a prior final-summary.json instead of the warm-start file.",
+    )
     return parser
 
 
 def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
-
-    workspace_root = Path(__file__).resolve().parent
+    workspace_root = WORKSPACE_ROOT
     config_path = workspace_root / args.config
+    if not config_path.is_file():
+        parser.error(f"config not found: {config_path}")
+
+    # Imported only once arguments are valid, so --help and usage errors
+    # never pay for the orchestrator's import graph.
+    from evo.config import EvolutionConfig
+    from evo.io_utils import decode_json, encode_json
+    from evo.orchestrator import EvolutionOrchestrator
+
     config = EvolutionConfig.from_file(config_path)
     if args.max_epochs is not None:
         config.max_epochs = args.max_epochs
@@ -71,6 +103,15 @@ def main() -> int:
         config.continuous = True
     if args.max_wall_minutes is not None:
         config.max_wall_seconds = max(0, args.max_wall_minutes) * 60
+    resume_summary = None
+    if args.resume_from_summary is not None:
+        summary_path = workspace_root / args.resume_from_summary
+        try:
+            resume_summary = decode_json(summary_path.read_bytes())
+        except (OSError, ValueError) as exc:
+            parser.error(f"cannot read summary {summary_path}: {exc}")
+        if not isinstance(resume_summary, dict):
+            parser.error(f"summary is not a JSON object: {summary_path}")
 
     orchestrator = EvolutionOrchestrator(
         workspace_root=workspace_root,
@@ -79,9 +120,22 @@ def main() -> int:
         disable_mutation=args.disable_mutation,
         progress_enabled=not args.no_progress,
         heartbeat_seconds=max(1, args.heartbeat_seconds),
+        warm_start=not args.no_warm_start,
+        evolution_timeout=args.evolution_timeout,
+        candidate_timeout=args.candidate_timeout,
+        resume_summary=resume_summary,
     )
     final_summary = orchestrator.run()
-    print(json.dumps(final_summary, ensure_ascii=True, indent=2))
+    # encode_json yields newline-terminated UTF-8 bytes, the same bytes as
+    # final-summary.json; skip the text layer unless stdout has no buffer.
+    data = encode_json(final_summary)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8"))
+    else:
+        sys.stdout.flush()
+        buffer.write(data)
+        buffer.flush()
     return 0
 
 